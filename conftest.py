@@ -5,6 +5,11 @@ Pytest configuration and shared fixtures
 import pytest
 import os
 import logging
+from unittest.mock import Mock
+
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_vpc import VpcV1
+from utils import VPCManager
 
 # Configure logging for tests
 logging.basicConfig(
@@ -17,6 +22,13 @@ logging.getLogger('ibm_cloud_sdk_core').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 
+def pytest_addoption(parser):
+    """Add command line options for opting into slow tests"""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers"""
     config.addinivalue_line(
@@ -37,6 +49,13 @@ def pytest_collection_modifyitems(config, items):
         # Mark slow tests
         if any(keyword in item.name.lower() for keyword in ['performance', 'large', 'concurrent']):
             item.add_marker(pytest.mark.slow)
+    
+    # Skip slow tests unless explicitly requested
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
@@ -57,6 +76,24 @@ def test_resource_group():
     return os.getenv('IBM_CLOUD_TEST_RESOURCE_GROUP')
 
 
+@pytest.fixture(scope="module")
+def mock_authenticator():
+    """Create a mock IAM authenticator"""
+    return Mock(spec=IAMAuthenticator)
+
+
+@pytest.fixture(scope="session")
+def vpc_service_mock():
+    """Create one VpcV1-specced mock service shared by the whole session; reset it before use"""
+    return Mock(spec=VpcV1)
+
+
+@pytest.fixture
+def vpc_manager(mock_authenticator):
+    """Create a VPCManager instance with mocked authenticator"""
+    return VPCManager(mock_authenticator)
+
+
 @pytest.fixture
 def mock_datetime():
     """Mock datetime for consistent testing"""
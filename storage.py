@@ -31,9 +31,10 @@ class StorageManager:
     Manages IBM Cloud VPC storage resources including block volumes and file shares
     """
     
-    def __init__(self, vpc_service, authenticator):
-        """Initialize with VPC service client and authenticator"""
+    def __init__(self, vpc_service, authenticator, http_session=None):
+        """Initialize with VPC service client and authenticator, optionally sharing a pooled HTTP session"""
         self.authenticator = authenticator
+        self.http_session = http_session
         self.vpc_clients = {}  # Cache VPC clients by region
     
     def _get_vpc_client(self, region: str):
@@ -42,6 +43,8 @@ class StorageManager:
             import ibm_vpc
             service = ibm_vpc.VpcV1(version='2025-04-08',authenticator=self.authenticator)
             service.set_service_url(f'https://{region}.iaas.cloud.ibm.com/v1')
+            if self.http_session is not None:
+                service.set_http_client(self.http_session)
             self.vpc_clients[region] = service
         return self.vpc_clients[region]
     
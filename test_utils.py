@@ -2,34 +2,146 @@
 Unit tests for IBM Cloud VPC utilities
 """
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+import asyncio
 import json
+import threading
+import time
+import types
+from collections.abc import Mapping
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
 
 from utils import (
     VPCManager, 
     create_vpc_manager, 
     analyze_security_rule_risk, 
-    analyze_backup_policy_health
+    analyze_security_rule_risks,
+    analyze_backup_policy_health,
+    _call_api,
+    _orjson_response_hook
 )
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from ibm_cloud_sdk_core import ApiException
+from storage import StorageManager
+
+# PNG header bytes that can't be decoded as UTF-8, and their base64 encoding
+PNG_BYTES = bytes.fromhex("89504e470d0a1a0a0000000d49484452")
+EXPECTED_PNG_B64 = "iVBORw0KGgoAAAANSUhEUg=="
+
+# Read-only API payloads shared across tests; hand them to mocks through thaw()
+_IKE_POLICY = MappingProxyType({
+    'id': 'ike-policy-1',
+    'name': 'main-ike-policy',
+    'authentication_algorithm': 'sha1',
+    'encryption_algorithm': 'aes128',
+    'dh_group': 2,
+    'ike_version': 1
+})
+
+_IPSEC_POLICY = MappingProxyType({
+    'id': 'ipsec-policy-1',
+    'name': 'main-ipsec-policy',
+    'authentication_algorithm': 'sha1',
+    'encryption_algorithm': 'aes128',
+    'pfs': 'group_2',
+    'protocol': 'esp'
+})
+
+_ROUTES_DATA = MappingProxyType({
+    'routes': (
+        MappingProxyType({
+            'id': 'route-1',
+            'name': 'main-route',
+            'destination': '10.0.0.0/24',
+            'action': 'translate'
+        }),
+        MappingProxyType({
+            'id': 'route-2',
+            'name': 'secondary-route',
+            'destination': '192.168.0.0/16',
+            'action': 'translate'
+        })
+    )
+})
+
+_CLIENTS_DATA = MappingProxyType({
+    'clients': (
+        MappingProxyType({
+            'id': 'client-1',
+            'common_name': 'user1.example.com',
+            'username': 'user1',
+            'status': 'connected',
+            'client_ip': '10.240.0.4',
+            'created_at': '2023-01-01T00:00:00Z',
+            'connected_at': '2023-01-01T10:00:00Z'
+        }),
+        MappingProxyType({
+            'id': 'client-2',
+            'common_name': 'user2.example.com',
+            'username': 'user2',
+            'status': 'disconnected',
+            'client_ip': '10.240.0.5',
+            'created_at': '2023-01-02T00:00:00Z'
+        })
+    ),
+    'total_count': 2,
+    'limit': 50
+})
+
+_CLIENTS_PAGE_DATA = MappingProxyType({
+    'clients': (
+        MappingProxyType({
+            'id': 'client-3',
+            'common_name': 'user3.example.com',
+            'username': 'user3',
+            'status': 'connected',
+            'created_at': '2023-01-03T00:00:00Z'
+        }),
+    ),
+    'total_count': 1,
+    'limit': 25
+})
+
+
+def thaw(payload):
+    """Return a mutable copy of a frozen payload constant
+
+    VPCManager tags API results in place (e.g. adding 'region'), so mocks must not return the shared constant itself.
+    """
+    if isinstance(payload, Mapping):
+        return {key: thaw(value) for key, value in payload.items()}
+    if isinstance(payload, tuple):
+        return [thaw(item) for item in payload]
+    return payload
+
+
+def stub_service(**results):
+    """Build a lightweight VPC service stub whose methods return canned results
+
+    Use this instead of Mock() when a test never asserts on how the service was called.
+    """
+    service = types.SimpleNamespace()
+    for method, result in results.items():
+        setattr(service, method,
+                lambda *args, _result=result, **kwargs: types.SimpleNamespace(get_result=lambda: _result))
+    return service
+
+
+def backup_jobs(status, count):
+    """Build `count` backup jobs with the given status, newest first, one per day starting today"""
+    now = datetime.now(timezone.utc)
+    return [
+        {'status': status, 'created_at': (now - timedelta(days=day)).strftime('%Y-%m-%dT%H:%M:%SZ')}
+        for day in range(count)
+    ]
 
 
 class TestVPCManager:
     """Test cases for VPCManager class"""
     
-    @pytest.fixture
-    def mock_authenticator(self):
-        """Create a mock IAM authenticator"""
-        return Mock(spec=IAMAuthenticator)
-    
-    @pytest.fixture
-    def vpc_manager(self, mock_authenticator):
-        """Create a VPCManager instance with mocked authenticator"""
-        return VPCManager(mock_authenticator)
-    
     @pytest.fixture
     def mock_vpc_service(self):
         """Create a mock VPC service"""
@@ -37,6 +149,12 @@ class TestVPCManager:
         service.set_service_url = Mock()
         return service
     
+    @pytest.fixture
+    def patched_vpcv1(self):
+        """Patch the VpcV1 class used by VPCManager to build regional clients"""
+        with patch('utils.ibm_vpc.VpcV1') as mock_vpc_class:
+            yield mock_vpc_class
+    
     def test_init(self, mock_authenticator):
         """Test VPCManager initialization"""
         manager = VPCManager(mock_authenticator)
@@ -44,15 +162,14 @@ class TestVPCManager:
         assert manager.vpc_clients == {}
         assert manager.regions == []
     
-    @patch('utils.ibm_vpc.VpcV1')
-    def test_get_vpc_client_new_region(self, mock_vpc_class, vpc_manager):
+    def test_get_vpc_client_new_region(self, patched_vpcv1, vpc_manager):
         """Test creating a new VPC client for a region"""
         mock_service = Mock()
-        mock_vpc_class.return_value = mock_service
+        patched_vpcv1.return_value = mock_service
         
         client = vpc_manager._get_vpc_client('us-south')
         
-        mock_vpc_class.assert_called_once_with(
+        patched_vpcv1.assert_called_once_with(
             version='2025-04-08',
             authenticator=vpc_manager.authenticator
         )
@@ -61,133 +178,334 @@ class TestVPCManager:
         )
         assert vpc_manager.vpc_clients['us-south'] == mock_service
         assert client == mock_service
+        mock_service.set_http_client.assert_called_once_with(vpc_manager.http_session)
     
-    @patch('utils.ibm_vpc.VpcV1')
-    def test_get_vpc_client_cached_region(self, mock_vpc_class, vpc_manager):
+    def test_storage_manager_shares_http_session(self, patched_vpcv1, vpc_manager):
+        """Test that storage clients reuse the VPC manager's pooled session"""
+        storage_manager = StorageManager(None, vpc_manager.authenticator, http_session=vpc_manager.http_session)
+        
+        client = storage_manager._get_vpc_client('us-south')
+        
+        client.set_http_client.assert_called_once_with(vpc_manager.http_session)
+    
+    def test_get_vpc_client_cached_region(self, patched_vpcv1, vpc_manager):
         """Test retrieving cached VPC client"""
         mock_service = Mock()
         vpc_manager.vpc_clients['us-south'] = mock_service
         
         client = vpc_manager._get_vpc_client('us-south')
         
-        mock_vpc_class.assert_not_called()
+        patched_vpcv1.assert_not_called()
         assert client == mock_service
     
-    @pytest.mark.asyncio
-    async def test_list_regions_success(self, vpc_manager):
+    async def test_cached_reference_listings_call_sdk_off_event_loop(self, vpc_manager, monkeypatch):
+        """Test that cached region and profile fetches (and so their background refreshes) run on the API pool"""
+        threads = []
+        
+        def listing(collection):
+            def call(**kwargs):
+                threads.append(threading.current_thread().name)
+                return types.SimpleNamespace(get_result=lambda: {collection: []})
+            return call
+        
+        service = types.SimpleNamespace(list_regions=listing('regions'), list_instance_profiles=listing('profiles'))
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: service)
+        await vpc_manager.list_regions()
+        await vpc_manager.list_instance_profiles('us-south')
+        
+        assert len(threads) == 2
+        assert all(name.startswith('vpc-api') for name in threads)
+    
+    async def test_list_regions_success(self, vpc_manager, monkeypatch):
         """Test successful region listing"""
-        mock_service = Mock()
-        mock_response = {
+        mock_service = stub_service(list_regions={
             'regions': [
                 {'name': 'us-south', 'status': 'available'},
                 {'name': 'us-east', 'status': 'available'}
             ]
-        }
-        mock_service.list_regions.return_value.get_result.return_value = mock_response
+        })
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.list_regions()
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_regions()
         
         assert result['count'] == 2
         assert len(result['regions']) == 2
         assert vpc_manager.regions == ['us-south', 'us-east']
     
-    @pytest.mark.asyncio
-    async def test_list_vpcs_single_region(self, vpc_manager):
-        """Test listing VPCs in a single region"""
+    async def test_list_regions_cached(self, vpc_manager, monkeypatch):
+        """Test that repeated region listings within the TTL reuse the first response"""
         mock_service = Mock()
-        mock_response = {
+        mock_service.list_regions.return_value.get_result.return_value = {
+            'regions': [{'name': 'us-south', 'status': 'available'}]
+        }
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        first = await vpc_manager.list_regions()
+        second = await vpc_manager.list_regions()
+        
+        assert second is first
+        mock_service.list_regions.assert_called_once()
+    
+    async def test_list_regions_refresh_bypasses_caches(self, mock_authenticator, tmp_path, monkeypatch):
+        """Test that refresh=True refetches regions past both the memory and disk caches"""
+        manager = VPCManager(mock_authenticator, cache_dir=str(tmp_path))
+        mock_service = Mock()
+        mock_service.list_regions.return_value.get_result.side_effect = [
+            {'regions': [{'name': 'us-south', 'status': 'available'}]},
+            {'regions': [{'name': 'us-south', 'status': 'available'}, {'name': 'eu-de', 'status': 'available'}]}
+        ]
+        monkeypatch.setattr(manager, '_get_vpc_client', lambda region: mock_service)
+        
+        await manager.list_regions()
+        refreshed = await manager.list_regions(refresh=True)
+        cached = await manager.list_regions()
+        
+        assert refreshed['count'] == 2
+        assert cached is refreshed
+        assert manager.regions == ['us-south', 'eu-de']
+        assert mock_service.list_regions.call_count == 2
+    
+    async def test_get_vpc_serves_stale_while_refreshing(self, vpc_manager, monkeypatch):
+        """Test that an expired get_vpc result is returned immediately and refreshed in the background"""
+        mock_service = Mock()
+        mock_service.get_vpc.return_value.get_result.side_effect = [
+            {'id': 'vpc-1', 'name': 'old-name'},
+            {'id': 'vpc-1', 'name': 'new-name'}
+        ]
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        first = await vpc_manager.get_vpc('vpc-1', 'us-south')
+        # Age the entry past its TTL but within the stale window
+        key = next(iter(vpc_manager._ttl_cache))
+        vpc_manager._ttl_cache[key] = (time.monotonic() - 1, first)
+        
+        stale = await vpc_manager.get_vpc('vpc-1', 'us-south')
+        await asyncio.gather(*vpc_manager._background_tasks)
+        fresh = await vpc_manager.get_vpc('vpc-1', 'us-south')
+        
+        assert stale['name'] == 'old-name'
+        assert fresh['name'] == 'new-name'
+        assert vpc_manager.cache_stats == {'hits': 1, 'misses': 1, 'stale': 1}
+    
+    async def test_catalogs_reused_from_disk_cache(self, mock_authenticator, tmp_path, monkeypatch):
+        """Test that a fresh manager sharing a cache directory skips refetching region and profile catalogs"""
+        mock_service = Mock()
+        mock_service.list_regions.return_value.get_result.return_value = {
+            'regions': [{'name': 'us-south', 'status': 'available'}]
+        }
+        mock_service.list_instance_profiles.return_value.get_result.return_value = {
+            'profiles': [{'name': 'bx2-2x8', 'family': 'balanced', 'vcpu_count': {'value': 2}}]
+        }
+        
+        first_manager = VPCManager(mock_authenticator, cache_dir=str(tmp_path))
+        monkeypatch.setattr(first_manager, '_get_vpc_client', lambda region: mock_service)
+        await first_manager.list_regions()
+        profiles = await first_manager.list_instance_profiles('us-south')
+        
+        second_manager = VPCManager(mock_authenticator, cache_dir=str(tmp_path))
+        monkeypatch.setattr(second_manager, '_get_vpc_client', lambda region: mock_service)
+        await second_manager.list_regions()
+        
+        assert second_manager.regions == ['us-south']
+        assert await second_manager.list_instance_profiles('us-south') == profiles
+        mock_service.list_regions.assert_called_once()
+        mock_service.list_instance_profiles.assert_called_once()
+    
+    async def test_list_vpcs_single_region(self, vpc_manager, monkeypatch):
+        """Test listing VPCs in a single region"""
+        mock_service = stub_service(list_vpcs={
             'vpcs': [
                 {'id': 'vpc-1', 'name': 'test-vpc-1'},
                 {'id': 'vpc-2', 'name': 'test-vpc-2'}
             ]
-        }
-        mock_service.list_vpcs.return_value.get_result.return_value = mock_response
+        })
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.list_vpcs('us-south')
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_vpcs('us-south')
         
         assert result['count'] == 2
         assert len(result['vpcs']) == 2
         assert all(vpc['region'] == 'us-south' for vpc in result['vpcs'])
         assert result['regions_checked'] == ['us-south']
     
-    @pytest.mark.asyncio
-    async def test_list_vpcs_all_regions(self, vpc_manager):
+    @pytest.mark.parametrize("regions", [
+        ['us-south'],
+        ['us-south', 'us-east'],
+        ['us-south', 'us-east', 'eu-de', 'jp-tok']
+    ])
+    async def test_list_vpcs_all_regions(self, vpc_manager, monkeypatch, regions):
         """Test listing VPCs across all regions"""
-        vpc_manager.regions = ['us-south', 'us-east']
+        vpc_manager.regions = regions
         
-        mock_service = Mock()
-        mock_response = {
+        mock_service = stub_service(list_vpcs={
             'vpcs': [{'id': 'vpc-1', 'name': 'test-vpc'}]
-        }
-        mock_service.list_vpcs.return_value.get_result.return_value = mock_response
+        })
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.list_vpcs()
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_vpcs()
         
-        assert result['count'] == 2  # One VPC per region
-        assert result['regions_checked'] == ['us-south', 'us-east']
+        assert result['count'] == len(regions)  # One VPC per region
+        assert result['regions_checked'] == regions
     
-    @pytest.mark.asyncio
-    async def test_list_vpcs_with_api_exception(self, vpc_manager):
+    async def test_list_vpcs_with_api_exception(self, vpc_manager, monkeypatch):
         """Test handling API exceptions when listing VPCs"""
         vpc_manager.regions = ['us-south', 'us-east']
         
-        def mock_get_client(region):
-            service = Mock()
-            if region == 'us-south':
-                service.list_vpcs.return_value.get_result.return_value = {
-                    'vpcs': [{'id': 'vpc-1', 'name': 'test-vpc'}]
-                }
-            else:
-                service.list_vpcs.side_effect = ApiException(
-                    message="Region not available", code=404
-                )
-            return service
+        services = {
+            'us-south': stub_service(list_vpcs={
+                'vpcs': [{'id': 'vpc-1', 'name': 'test-vpc'}]
+            }),
+            'us-east': Mock()
+        }
+        services['us-east'].list_vpcs.side_effect = ApiException(
+            message="Region not available", code=404
+        )
         
-        with patch.object(vpc_manager, '_get_vpc_client', side_effect=mock_get_client):
-            result = await vpc_manager.list_vpcs()
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', services.__getitem__)
+        result = await vpc_manager.list_vpcs()
         
         assert result['count'] == 1  # Only successful region
         assert result['vpcs'][0]['region'] == 'us-south'
     
-    @pytest.mark.asyncio
-    async def test_get_vpc_success(self, vpc_manager):
+    async def test_iter_vpcs_yields_each_region(self, vpc_manager, monkeypatch):
+        """Test that iter_vpcs yields one tagged batch per region"""
+        vpc_manager.regions = ['us-south', 'eu-de']
+        mock_service = stub_service(list_vpcs={'vpcs': [{'id': 'vpc-1', 'name': 'test-vpc'}]})
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        batches = {region: vpcs async for region, vpcs in vpc_manager.iter_vpcs()}
+        
+        assert set(batches) == {'us-south', 'eu-de'}
+        assert all(len(vpcs) == 1 for vpcs in batches.values())
+    
+    async def test_iter_vpcs_respects_max_concurrency(self, mock_authenticator, monkeypatch):
+        """Test that region listings never exceed the configured number of in-flight requests"""
+        manager = VPCManager(mock_authenticator, max_concurrency=1)
+        manager.regions = ['us-south', 'us-east', 'eu-de']
+        in_flight = 0
+        peak = 0
+        guard = threading.Lock()
+        
+        def list_vpcs(**kwargs):
+            nonlocal in_flight, peak
+            with guard:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with guard:
+                in_flight -= 1
+            return types.SimpleNamespace(get_result=lambda: {'vpcs': []})
+        
+        monkeypatch.setattr(manager, '_get_vpc_client', lambda region: types.SimpleNamespace(list_vpcs=list_vpcs))
+        batches = [region async for region, _ in manager.iter_vpcs()]
+        
+        assert sorted(batches) == sorted(manager.regions)
+        assert peak == 1
+    
+    async def test_iter_vpcs_skips_stalled_region(self, vpc_manager, monkeypatch):
+        """Test that a region exceeding the fan-out timeout is skipped instead of blocking the rest"""
+        vpc_manager.regions = ['us-south', 'eu-de']
+        vpc_manager.FAN_OUT_TIMEOUT = 0.05
+        
+        def client_for(region):
+            def list_vpcs(**kwargs):
+                if region == 'eu-de':
+                    time.sleep(0.3)
+                return types.SimpleNamespace(get_result=lambda: {'vpcs': [{'id': f'vpc-{region}'}]})
+            return types.SimpleNamespace(list_vpcs=list_vpcs)
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', client_for)
+        batches = {region: vpcs async for region, vpcs in vpc_manager.iter_vpcs()}
+        
+        assert batches == {'us-south': [{'id': 'vpc-us-south', 'region': 'us-south'}]}
+    
+    async def test_get_vpc_success(self, vpc_manager, monkeypatch):
         """Test getting a specific VPC"""
         mock_service = Mock()
         mock_vpc = {'id': 'vpc-1', 'name': 'test-vpc', 'status': 'available'}
         mock_service.get_vpc.return_value.get_result.return_value = mock_vpc
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.get_vpc('vpc-1', 'us-south')
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.get_vpc('vpc-1', 'us-south')
         
         mock_service.get_vpc.assert_called_once_with(id='vpc-1')
         assert result['region'] == 'us-south'
         assert result['id'] == 'vpc-1'
     
-    @pytest.mark.asyncio
-    async def test_list_subnets_with_vpc_filter(self, vpc_manager):
+    async def test_list_subnets_with_vpc_filter(self, vpc_manager, monkeypatch):
         """Test listing subnets filtered by VPC"""
-        mock_service = Mock()
-        mock_response = {
+        mock_service = stub_service(list_subnets={
             'subnets': [
                 {'id': 'subnet-1', 'vpc': {'id': 'vpc-1'}, 'available_ipv4_address_count': 250},
                 {'id': 'subnet-2', 'vpc': {'id': 'vpc-2'}, 'available_ipv4_address_count': 100},
                 {'id': 'subnet-3', 'vpc': {'id': 'vpc-1'}, 'available_ipv4_address_count': 200}
             ]
-        }
-        mock_service.list_subnets.return_value.get_result.return_value = mock_response
+        })
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.list_subnets('us-south', vpc_id='vpc-1')
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_subnets('us-south', vpc_id='vpc-1')
         
         assert result['count'] == 2  # Only subnets in vpc-1
         assert all(subnet['vpc']['id'] == 'vpc-1' for subnet in result['subnets'])
         assert result['vpc_filter'] == 'vpc-1'
     
-    @pytest.mark.asyncio
-    async def test_analyze_ssh_security_groups(self, vpc_manager):
+    async def test_list_subnets_overlapping_calls_share_request(self, vpc_manager, monkeypatch):
+        """Test that overlapping identical subnet listings issue a single API call"""
+        mock_service = Mock()
+        mock_service.list_subnets.return_value.get_result.return_value = {
+            'subnets': [{'id': 'subnet-1', 'vpc': {'id': 'vpc-1'}}]
+        }
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        first, second = await asyncio.gather(
+            vpc_manager.list_subnets('us-south'),
+            vpc_manager.list_subnets('us-south')
+        )
+        
+        assert first is second
+        mock_service.list_subnets.assert_called_once()
+        assert vpc_manager._inflight == {}
+    
+    async def test_list_security_groups_follows_pages(self, vpc_manager, monkeypatch):
+        """Test that security groups beyond the first page are listed, using the largest page size"""
+        mock_service = Mock()
+        mock_service.list_security_groups.side_effect = [
+            Mock(get_result=Mock(return_value={
+                'security_groups': [{'id': 'sg-1', 'name': 'web-sg', 'vpc': {'id': 'vpc-1'},
+                                     'created_at': '2023-01-01T00:00:00Z'}],
+                'next': {'href': 'https://us-south.iaas.cloud.ibm.com/v1/security_groups?start=page-2&limit=100'}
+            })),
+            Mock(get_result=Mock(return_value={
+                'security_groups': [{'id': 'sg-2', 'name': 'db-sg', 'vpc': {'id': 'vpc-1'},
+                                     'created_at': '2023-01-02T00:00:00Z'}]
+            }))
+        ]
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_security_groups('us-south', 'vpc-1')
+        
+        assert [sg['id'] for sg in result['security_groups']] == ['sg-1', 'sg-2']
+        mock_service.list_security_groups.assert_called_with(limit=100, start='page-2')
+    
+    async def test_list_subnets_reuses_vpc_index(self, vpc_manager, monkeypatch):
+        """Test that filtering one region by different VPCs reuses a single subnet listing"""
+        mock_service = Mock()
+        mock_service.list_subnets.return_value.get_result.return_value = {
+            'subnets': [
+                {'id': 'subnet-1', 'vpc': {'id': 'vpc-1'}},
+                {'id': 'subnet-2', 'vpc': {'id': 'vpc-2'}}
+            ]
+        }
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        vpc_1 = await vpc_manager.list_subnets('us-south', vpc_id='vpc-1')
+        vpc_2 = await vpc_manager.list_subnets('us-south', vpc_id='vpc-2')
+        
+        assert [subnet['id'] for subnet in vpc_1['subnets']] == ['subnet-1']
+        assert [subnet['id'] for subnet in vpc_2['subnets']] == ['subnet-2']
+        mock_service.list_subnets.assert_called_once()
+    
+    async def test_analyze_ssh_security_groups(self, vpc_manager, monkeypatch):
         """Test SSH security group analysis"""
         mock_service = Mock()
         
@@ -200,45 +518,199 @@ class TestVPCManager:
         }
         mock_service.list_security_groups.return_value.get_result.return_value = sg_response
         
-        # Mock rules responses
-        def mock_list_rules(security_group_id):
-            if security_group_id == 'sg-1':
-                # Risky rule: SSH from anywhere
-                return Mock(get_result=lambda: {
-                    'rules': [{
-                        'id': 'rule-1',
-                        'protocol': 'tcp',
-                        'direction': 'inbound',
-                        'port_min': 22,
-                        'port_max': 22,
-                        'remote': {'cidr_block': '0.0.0.0/0'}
-                    }]
-                })
-            else:
-                # Safe rule: SSH from specific IP
-                return Mock(get_result=lambda: {
-                    'rules': [{
-                        'id': 'rule-2',
-                        'protocol': 'tcp',
-                        'direction': 'inbound',
-                        'port_min': 22,
-                        'port_max': 22,
-                        'remote': {'cidr_block': '10.0.0.0/8'}
-                    }]
-                })
+        # Rules responses, built once and looked up by security group ID
+        rules_responses = {
+            # Risky rule: SSH from anywhere
+            'sg-1': types.SimpleNamespace(get_result=lambda: {
+                'rules': [{
+                    'id': 'rule-1',
+                    'protocol': 'tcp',
+                    'direction': 'inbound',
+                    'port_min': 22,
+                    'port_max': 22,
+                    'remote': {'cidr_block': '0.0.0.0/0'}
+                }]
+            }),
+            # Safe rule: SSH from specific IP
+            'sg-2': types.SimpleNamespace(get_result=lambda: {
+                'rules': [{
+                    'id': 'rule-2',
+                    'protocol': 'tcp',
+                    'direction': 'inbound',
+                    'port_min': 22,
+                    'port_max': 22,
+                    'remote': {'cidr_block': '10.0.0.0/8'}
+                }]
+            })
+        }
         
-        mock_service.list_security_group_rules = mock_list_rules
+        mock_service.list_security_group_rules = \
+            lambda security_group_id: rules_responses[security_group_id]
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.analyze_ssh_security_groups('us-south', 'vpc-1')
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.analyze_ssh_security_groups('us-south', 'vpc-1')
         
         assert result['count'] == 1
         assert len(result['risky_security_groups']) == 1
         assert result['risky_security_groups'][0]['security_group_name'] == 'risky-sg'
         assert result['analysis_type'] == 'SSH access from 0.0.0.0/0'
     
-    @pytest.mark.asyncio
-    async def test_list_backup_policies_success(self, vpc_manager):
+    async def test_analyze_ssh_security_groups_all_regions(self, vpc_manager, monkeypatch):
+        """Test that the account-wide SSH sweep tags findings by region and reports failed regions"""
+        vpc_manager.regions = ['us-south', 'eu-de']
+        ssh_rule = {'id': 'rule-1', 'protocol': 'tcp', 'direction': 'inbound',
+                    'port_min': 22, 'port_max': 22, 'remote': {'cidr_block': '0.0.0.0/0'}}
+        
+        def client_for(region):
+            service = Mock()
+            if region == 'eu-de':
+                service.list_security_groups.side_effect = ApiException(503, message='unavailable')
+            else:
+                service.list_security_groups.return_value.get_result.return_value = {
+                    'security_groups': [{'id': 'sg-1', 'name': 'risky-sg', 'vpc': {'id': 'vpc-1'},
+                                         'rules': [ssh_rule]}]
+                }
+            return service
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', client_for)
+        result = await vpc_manager.analyze_ssh_security_groups_all_regions()
+        
+        assert result['count'] == 1
+        assert result['risky_security_groups'][0]['region'] == 'us-south'
+        assert list(result['region_errors']) == ['eu-de']
+    
+    async def test_list_security_group_rules_is_live_read(self, vpc_manager, monkeypatch):
+        """Test that the rule listing always refetches and refreshes the analyzers' cached rules"""
+        mock_service = Mock()
+        mock_service.list_security_groups.return_value.get_result.return_value = {
+            'security_groups': [{'id': 'sg-1', 'name': 'web-sg', 'vpc': {'id': 'vpc-1'}}]
+        }
+        mock_service.list_security_group_rules.return_value.get_result.return_value = {
+            'rules': [{'id': 'rule-1', 'protocol': 'tcp', 'direction': 'inbound',
+                       'port_min': 22, 'port_max': 22, 'remote': {'cidr_block': '0.0.0.0/0'}}]
+        }
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        await vpc_manager.analyze_ssh_security_groups('us-south', 'vpc-1')
+        result = await vpc_manager.list_security_group_rules('sg-1', 'us-south')
+        await vpc_manager.analyze_ssh_security_groups('us-south', 'vpc-1')
+        
+        assert result['count'] == 1
+        assert mock_service.list_security_group_rules.call_count == 2
+    
+    async def test_security_group_rules_cache_evicts_least_recently_used(self, vpc_manager):
+        """Test that the per-group rule cache stays within its size bound"""
+        vpc_manager.SG_RULES_CACHE_MAXSIZE = 2
+        mock_service = Mock()
+        mock_service.list_security_group_rules.return_value.get_result.return_value = {'rules': []}
+        
+        await vpc_manager._collect_security_group_rules(mock_service, 'us-south', [{'id': 'sg-1'}, {'id': 'sg-2'}])
+        await vpc_manager._collect_security_group_rules(mock_service, 'us-south', [{'id': 'sg-1'}])
+        await vpc_manager._collect_security_group_rules(mock_service, 'us-south', [{'id': 'sg-3'}])
+        
+        assert list(vpc_manager._sg_rules_cache) == [('us-south', 'sg-1'), ('us-south', 'sg-3')]
+    
+    async def test_analyze_security_groups_by_protocol_uses_embedded_rules(self, vpc_manager, monkeypatch):
+        """Test that rules embedded in the security group listing are used without per-group fetches"""
+        mock_service = Mock()
+        mock_service.list_security_groups.return_value.get_result.return_value = {
+            'security_groups': [{
+                'id': 'sg-1',
+                'name': 'web-sg',
+                'vpc': {'id': 'vpc-1'},
+                'rules': [{
+                    'id': 'rule-1',
+                    'protocol': 'tcp',
+                    'direction': 'inbound',
+                    'port_min': 443,
+                    'port_max': 443,
+                    'remote': {'cidr_block': '0.0.0.0/0'}
+                }]
+            }]
+        }
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.analyze_security_groups_by_protocol('us-south', 'tcp', port=443)
+        
+        assert result['count'] == 1
+        assert result['matching_security_groups'][0]['matching_rules'][0]['id'] == 'rule-1'
+        mock_service.list_security_group_rules.assert_not_called()
+    
+    async def test_analyze_security_groups_by_protocol_matches_covering_cidr(self, vpc_manager, monkeypatch):
+        """Test that a rule from a broader CIDR matches a narrower requested source"""
+        mock_service = Mock()
+        mock_service.list_security_groups.return_value.get_result.return_value = {
+            'security_groups': [{
+                'id': 'sg-1',
+                'name': 'internal-sg',
+                'vpc': {'id': 'vpc-1'},
+                'rules': [
+                    {'id': 'rule-1', 'protocol': 'tcp', 'direction': 'inbound',
+                     'port_min': 5432, 'port_max': 5432, 'remote': {'cidr_block': '10.0.0.0/8'}},
+                    {'id': 'rule-2', 'protocol': 'tcp', 'direction': 'inbound',
+                     'port_min': 5432, 'port_max': 5432, 'remote': {'cidr_block': '10.1.2.0/24'}}
+                ]
+            }]
+        }
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.analyze_security_groups_by_protocol(
+            'us-south', 'tcp', port=5432, source_cidr='10.1.0.0/16'
+        )
+        
+        assert result['count'] == 1
+        assert [r['id'] for r in result['matching_security_groups'][0]['matching_rules']] == ['rule-1']
+    
+    async def test_list_all_routing_tables_follows_pages(self, vpc_manager, monkeypatch):
+        """Test that every page of routing tables is fetched by following the next cursor"""
+        mock_service = Mock()
+        mock_service.list_vpc_routing_tables.side_effect = [
+            Mock(get_result=Mock(return_value={
+                'routing_tables': [{'id': 'rt-1', 'name': 'default-rt'}],
+                'next': {'href': 'https://us-south.iaas.cloud.ibm.com/v1/vpcs/vpc-1/routing_tables?start=page-2'}
+            })),
+            Mock(get_result=Mock(return_value={
+                'routing_tables': [{'id': 'rt-2', 'name': 'custom-rt'}]
+            }))
+        ]
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_all_routing_tables('us-south', 'vpc-1')
+        
+        assert [rt['id'] for rt in result['routing_tables']] == ['rt-1', 'rt-2']
+        assert mock_service.list_vpc_routing_tables.call_args_list[1].kwargs == {
+            'vpc_id': 'vpc-1', 'start': 'page-2'
+        }
+    
+    async def test_analyzers_reuse_security_group_listing(self, vpc_manager, monkeypatch):
+        """Test that analyzing after listing security groups doesn't refetch them"""
+        mock_service = Mock()
+        mock_service.list_security_groups.return_value.get_result.return_value = {
+            'security_groups': [{
+                'id': 'sg-1',
+                'name': 'open-sg',
+                'vpc': {'id': 'vpc-1'},
+                'created_at': '2023-01-01T00:00:00Z',
+                'rules': [{
+                    'id': 'rule-1',
+                    'protocol': 'tcp',
+                    'direction': 'inbound',
+                    'port_min': 22,
+                    'port_max': 22,
+                    'remote': {'cidr_block': '0.0.0.0/0'}
+                }]
+            }]
+        }
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        listing = await vpc_manager.list_security_groups('us-south', 'vpc-1')
+        ssh = await vpc_manager.analyze_ssh_security_groups('us-south', 'vpc-1')
+        by_protocol = await vpc_manager.analyze_security_groups_by_protocol('us-south', 'tcp', port=22)
+        
+        assert listing['count'] == ssh['count'] == by_protocol['count'] == 1
+        mock_service.list_security_groups.assert_called_once()
+    
+    async def test_list_backup_policies_success(self, vpc_manager, monkeypatch):
         """Test successful backup policy listing"""
         mock_service = Mock()
         mock_response = {
@@ -249,8 +721,8 @@ class TestVPCManager:
         }
         mock_service.list_backup_policies.return_value.get_result.return_value = mock_response
         
-        with patch.object(vpc_manager, '_get_vpc_client', return_value=mock_service):
-            result = await vpc_manager.list_backup_policies('us-south', name='daily')
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.list_backup_policies('us-south', name='daily')
         
         mock_service.list_backup_policies.assert_called_once_with(
             start=None,
@@ -262,14 +734,129 @@ class TestVPCManager:
         assert result['count'] == 2
         assert all(policy['region'] == 'us-south' for policy in result['backup_policies'])
     
-    @pytest.mark.asyncio
+    async def test_list_backup_policy_jobs_overlapping_calls_share_request(self, vpc_manager, monkeypatch):
+        """Test that overlapping identical backup job listings issue a single API call"""
+        mock_service = Mock()
+        mock_service.list_backup_policy_jobs.return_value.get_result.return_value = {
+            'jobs': backup_jobs('succeeded', 2)
+        }
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        
+        first, second = await asyncio.gather(
+            vpc_manager.list_backup_policy_jobs('policy-1', 'us-south', limit=10, sort='-created_at'),
+            vpc_manager.list_backup_policy_jobs('policy-1', 'us-south', limit=10, sort='-created_at')
+        )
+        
+        assert first is second
+        mock_service.list_backup_policy_jobs.assert_called_once()
+        assert vpc_manager._inflight == {}
+    
+    async def test_get_backup_policy_summary_isolates_section_errors(self, vpc_manager, monkeypatch):
+        """Test that a failed policy lookup doesn't prevent the plans and jobs sections from loading"""
+        mock_service = Mock()
+        mock_service.get_backup_policy.side_effect = ApiException(code=404, message="Not found")
+        mock_service.list_backup_policy_plans.return_value.get_result.return_value = {
+            'plans': [{'id': 'plan-1', 'name': 'daily'}]
+        }
+        mock_service.list_backup_policy_jobs.return_value.get_result.return_value = {
+            'jobs': backup_jobs('succeeded', 12)
+        }
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.get_backup_policy_summary('policy-1', 'us-south')
+        
+        assert 'Not found' in result['policy_details']['error']
+        assert result['plans']['count'] == 1
+        assert result['recent_jobs']['count'] == 12
+        assert len(result['recent_jobs']['jobs']) == 10
+        assert result['recent_jobs']['status_summary'] == {'succeeded': 12}
+    
+    async def test_bulk_backup_report_shares_jobs_between_summary_and_health(self, vpc_manager, monkeypatch):
+        """Test that each policy's jobs are fetched once and feed both its summary and health check"""
+        mock_service = Mock()
+        mock_service.list_backup_policies.return_value.get_result.return_value = {
+            'backup_policies': [{'id': 'policy-1', 'name': 'daily', 'lifecycle_state': 'stable'}]
+        }
+        mock_service.list_backup_policy_plans.return_value.get_result.return_value = {
+            'plans': [{'id': 'plan-1'}]
+        }
+        mock_service.list_backup_policy_jobs.return_value.get_result.return_value = {
+            'jobs': backup_jobs('succeeded', 6)
+        }
+        
+        monkeypatch.setattr(vpc_manager, '_get_vpc_client', lambda region: mock_service)
+        result = await vpc_manager.bulk_backup_report('us-south')
+        
+        report = result['reports'][0]
+        assert result['count'] == 1
+        assert report['summary']['policy_details']['name'] == 'daily'
+        assert report['summary']['recent_jobs']['count'] == 6
+        assert report['health']['status'] == 'healthy'
+        mock_service.get_backup_policy.assert_not_called()
+        mock_service.list_backup_policy_jobs.assert_called_once()
+    
+    async def test_analyze_backup_policies_bounds_job_fetches(self, mock_authenticator, monkeypatch):
+        """Test that per-policy job fetches overlap up to the configured limit and keep policy order"""
+        manager = VPCManager(mock_authenticator, backup_job_concurrency=2)
+        policies = [
+            {'id': f'policy-{n}', 'name': f'policy-{n}', 'lifecycle_state': 'stable'} for n in range(5)
+        ]
+        in_flight = 0
+        peak = 0
+        
+        async def fake_jobs(policy_id, region, limit=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if policy_id == 'policy-3':
+                raise ApiException(code=500, message="Internal error")
+            jobs = backup_jobs('failed' if policy_id == 'policy-1' else 'succeeded', 3)[:limit]
+            return {'jobs': jobs, 'count': len(jobs)}
+        
+        async def fake_policies(region, **kwargs):
+            return {'backup_policies': policies}
+        
+        monkeypatch.setattr(manager, 'list_backup_policies', fake_policies)
+        monkeypatch.setattr(manager, 'list_backup_policy_jobs', fake_jobs)
+        result = await manager.analyze_backup_policies('us-south')
+        
+        assert peak == 2
+        assert [p['policy_id'] for p in result['policy_health']] == [p['id'] for p in policies]
+        assert result['summary']['policies_with_failed_jobs'] == 1
+        assert result['policy_health'][1]['issues'] == ['3 recent failed jobs']
+        assert result['policy_health'][0]['last_job_status'] == 'succeeded'
+        assert 'Error retrieving jobs' in result['policy_health'][3]['issues'][0]
+    
+    async def test_analyze_backup_policies_ignores_old_failures(self, vpc_manager, monkeypatch):
+        """Test that a failure older than the recent job window is not reported"""
+        history = backup_jobs('succeeded', 12) + backup_jobs('failed', 1)
+        calls = []
+        
+        async def fake_jobs(policy_id, region, limit=None, sort=None, **kwargs):
+            calls.append((policy_id, limit, sort, kwargs))
+            return {'jobs': history[:limit], 'count': len(history[:limit])}
+        
+        async def fake_policies(region, **kwargs):
+            return {'backup_policies': [{'id': 'policy-1', 'name': 'daily', 'lifecycle_state': 'stable'}]}
+        
+        monkeypatch.setattr(vpc_manager, 'list_backup_policies', fake_policies)
+        monkeypatch.setattr(vpc_manager, 'list_backup_policy_jobs', fake_jobs)
+        result = await vpc_manager.analyze_backup_policies('us-south')
+        
+        assert calls == [('policy-1', 10, '-created_at', {})]
+        assert result['summary']['policies_with_failed_jobs'] == 0
+        assert result['policy_health'][0]['issues'] == []
+        assert result['policy_health'][0]['last_job_status'] == 'succeeded'
+    
     async def test_get_vpc_resources_summary(self, vpc_manager):
         """Test VPC resources summary generation"""
         # Mock all the individual method calls
         with patch.object(vpc_manager, 'get_vpc') as mock_get_vpc, \
              patch.object(vpc_manager, 'list_subnets') as mock_list_subnets, \
              patch.object(vpc_manager, 'list_instances') as mock_list_instances, \
-             patch.object(vpc_manager, 'list_security_groups') as mock_list_sg, \
+             patch.object(vpc_manager, '_raw_security_groups') as mock_raw_sgs, \
              patch.object(vpc_manager, 'list_public_gateways') as mock_list_pg, \
              patch.object(vpc_manager, 'analyze_ssh_security_groups') as mock_analyze_ssh:
             
@@ -290,7 +877,7 @@ class TestVPCManager:
                     {'status': 'stopped'}
                 ]
             }
-            mock_list_sg.return_value = {'count': 2}
+            mock_raw_sgs.return_value = [{'id': 'sg-1'}, {'id': 'sg-2'}]
             mock_list_pg.return_value = {'count': 1}
             mock_analyze_ssh.return_value = {
                 'count': 1, 'risky_security_groups': [
@@ -305,15 +892,112 @@ class TestVPCManager:
         assert result['vpc_details']['name'] == 'test-vpc'
         assert result['resources']['subnets']['count'] == 2
         assert result['resources']['instances']['count'] == 3
+        assert result['resources']['security_groups']['count'] == 2
         assert result['resources']['instances']['by_status']['running'] == 2
         assert result['resources']['instances']['by_status']['stopped'] == 1
+        assert result['resources']['subnets']['zones'] == ['us-south-1', 'us-south-2']
         assert result['security_analysis']['ssh_open_to_internet']['risky_groups_count'] == 1
+    
+    async def test_stream_vpc_resources_summary_yields_each_section(self, vpc_manager, monkeypatch):
+        """Test that every summary section is streamed, with failures reported in place"""
+        async def failing(*args, **kwargs):
+            raise ApiException(code=500, message="Internal error")
+        
+        async def count_only(*args, **kwargs):
+            return {'count': 0, 'subnets': [], 'instances': [], 'risky_security_groups': []}
+        
+        async def no_groups(*args, **kwargs):
+            return []
+        
+        monkeypatch.setattr(vpc_manager, 'get_vpc', failing)
+        monkeypatch.setattr(vpc_manager, '_raw_security_groups', no_groups)
+        for method in ('list_subnets', 'list_instances', 'list_public_gateways', 'analyze_ssh_security_groups'):
+            monkeypatch.setattr(vpc_manager, method, count_only)
+        
+        sections = {}
+        async for section, payload in vpc_manager.stream_vpc_resources_summary('vpc-1', 'us-south'):
+            sections[section] = payload
+        
+        assert set(sections) == {'vpc_details', 'subnets', 'instances', 'security_groups',
+                                 'public_gateways', 'security_analysis'}
+        assert 'Internal error' in sections['vpc_details']['error']
+        assert sections['instances'] == {'count': 0, 'by_status': {}}
+    
+    async def test_vpc_resources_summary_sections_in_fixed_order(self, vpc_manager, monkeypatch):
+        """Test that summary sections come back in the fixed order whatever order they finish in"""
+        async def reversed_stream(vpc_id, region):
+            for section in reversed(VPCManager._SUMMARY_SECTIONS):
+                yield section, {'section': section}
+        
+        monkeypatch.setattr(vpc_manager, 'stream_vpc_resources_summary', reversed_stream)
+        sections = await vpc_manager.vpc_resources_summary_sections('vpc-1', 'us-south')
+        
+        assert [section for section, _ in sections] == [
+            'vpc_details', 'subnets', 'instances', 'security_groups', 'public_gateways', 'security_analysis'
+        ]
+    
+    async def test_summary_tool_ndjson_lines_in_fixed_order(self, vpc_manager, monkeypatch):
+        """Test that every line of the summary tool's NDJSON is valid JSON and follows the fixed section order"""
+        # The server needs a working mcp install; skip where it cannot be imported
+        server_module = pytest.importorskip('vpc_mcp_server', exc_type=ImportError)
+        
+        async def reversed_stream(vpc_id, region):
+            for section in reversed(VPCManager._SUMMARY_SECTIONS):
+                yield section, {'section': section}
+        
+        monkeypatch.setattr(vpc_manager, 'stream_vpc_resources_summary', reversed_stream)
+        server = server_module.VPCMCPServer()
+        server.vpc_manager = vpc_manager
+        lines = [json.loads(line) for line in (await server._summary_ndjson('vpc-1', 'us-south')).split('\n')]
+        
+        assert lines[0]['vpc_id'] == 'vpc-1'
+        assert [next(iter(line)) for line in lines[1:]] == list(VPCManager._SUMMARY_SECTIONS)
 
+    
+    async def test_failed_startup_warmup_leaves_managers_unset(self, monkeypatch):
+        """Test that a failed warmup does not install managers, so the first tool call builds them again"""
+        # The server needs a working mcp install; skip where it cannot be imported
+        server_module = pytest.importorskip('vpc_mcp_server', exc_type=ImportError)
+        
+        async def unreachable(self, refresh=False):
+            raise requests.ConnectionError("IAM unreachable")
+        
+        monkeypatch.setenv('IBMCLOUD_API_KEY', 'test-key')
+        monkeypatch.setattr(VPCManager, 'list_regions', unreachable)
+        server = server_module.VPCMCPServer()
+        await server._startup()
+        
+        assert server.vpc_manager is None
+        assert server.storage_manager is None
 
 class TestUtilityFunctions:
     """Test cases for utility functions"""
     
-    @pytest.mark.asyncio
+    async def test_call_api_runs_on_api_worker_pool(self):
+        """Test that SDK calls run on the dedicated API pool rather than the default executor"""
+        service = types.SimpleNamespace(
+            get_vpc=lambda **kwargs: types.SimpleNamespace(
+                get_result=lambda: {'thread': threading.current_thread().name, **kwargs}
+            )
+        )
+        
+        result = await _call_api(service.get_vpc, id='vpc-1')
+        
+        assert result['thread'].startswith('vpc-api')
+        assert result['id'] == 'vpc-1'
+    
+    @pytest.mark.parametrize("body,expected", [
+        (b'{"vpcs": [{"id": "vpc-1"}]}', {'vpcs': [{'id': 'vpc-1'}]}),
+        (b'{"name": "a\x01b"}', {'name': 'a\x01b'}),
+    ], ids=['orjson', 'control_character_fallback'])
+    def test_orjson_response_hook(self, body, expected):
+        """Test that the response hook parses JSON bodies, deferring to the stdlib for non-strict JSON"""
+        pytest.importorskip('orjson')
+        response = requests.Response()
+        response._content = body
+        
+        assert _orjson_response_hook(response).json(strict=False) == expected
+    
     async def test_create_vpc_manager(self):
         """Test VPC manager creation with API key"""
         with patch('utils.IAMAuthenticator') as mock_auth_class:
@@ -394,58 +1078,91 @@ class TestUtilityFunctions:
         assert result['risk_level'] == 'medium'
         assert 'Very wide port range (1000-5000)' in result['risk_factors']
     
-    def test_analyze_backup_policy_health_healthy(self):
-        """Test backup policy health analysis for healthy policy"""
-        policy = {
-            'id': 'policy-1',
-            'lifecycle_state': 'stable'
+    def test_analyze_security_rule_risk_port_range_exposures(self):
+        """Test that every risky port inside a rule's range is reported, and only for TCP"""
+        rule = {
+            'id': 'rule-5',
+            'protocol': 'tcp',
+            'direction': 'inbound',
+            'port_min': 20,
+            'port_max': 25,
+            'remote': {'cidr_block': '10.0.0.0/8'}
         }
         
-        jobs = [
-            {'status': 'completed', 'created_at': '2023-12-01T00:00:00Z'},
-            {'status': 'completed', 'created_at': '2023-11-30T00:00:00Z'},
-            {'status': 'completed', 'created_at': '2023-11-29T00:00:00Z'}
-        ]
-        
-        result = analyze_backup_policy_health(policy, jobs)
+        result = analyze_security_rule_risk(rule)
         
-        assert result['status'] == 'healthy'
-        assert result['health_score'] >= 80
-        assert len(result['issues']) == 0
+        assert result['risk_level'] == 'medium'
+        assert result['risk_factors'] == [
+            'Exposes FTP (port 21)',
+            'Exposes SSH (port 22)',
+            'Exposes Telnet (port 23)',
+            'Exposes SMTP (port 25)'
+        ]
+        assert analyze_security_rule_risk({**rule, 'protocol': 'udp'})['risk_factors'] == []
     
-    def test_analyze_backup_policy_health_critical(self):
-        """Test backup policy health analysis for critical policy"""
-        policy = {
-            'id': 'policy-2',
-            'lifecycle_state': 'failed'
+    def test_analyze_security_rule_risks_matches_single_rule_analysis(self):
+        """Test that bulk analysis returns the same per-rule results, in order, as analyzing each rule"""
+        ssh_from_anywhere = {
+            'protocol': 'tcp', 'direction': 'inbound', 'port_min': 22, 'port_max': 22,
+            'remote': {'cidr_block': '0.0.0.0/0'}
         }
-        
-        jobs = [
-            {'status': 'failed', 'created_at': '2023-12-01T00:00:00Z'},
-            {'status': 'failed', 'created_at': '2023-11-30T00:00:00Z'}
+        rules = [
+            {'id': 'rule-1', **ssh_from_anywhere},
+            {'id': 'rule-2', 'protocol': 'all', 'direction': 'outbound', 'remote': {'cidr_block': '0.0.0.0/0'}},
+            {'id': 'rule-3', **ssh_from_anywhere},
+            {'id': 'rule-4', 'protocol': 'tcp', 'direction': 'inbound', 'port_min': 1000, 'port_max': 5000,
+             'remote': {'id': 'sg-2'}}
         ]
         
+        results = analyze_security_rule_risks(rules)
+        
+        assert results == [analyze_security_rule_risk(rule) for rule in rules]
+        assert results[0]['risk_factors'] is not results[2]['risk_factors']
+    
+    @pytest.mark.parametrize("policy,jobs,expected_status,score_check,expected_issues", [
+        (
+            {'id': 'policy-1', 'lifecycle_state': 'stable'},
+            backup_jobs('completed', 5),
+            'healthy', lambda score: score >= 80, []
+        ),
+        (
+            {'id': 'policy-2', 'lifecycle_state': 'failed'},
+            backup_jobs('failed', 2),
+            'critical', lambda score: score < 60, ['failed state', 'failure rate']
+        ),
+        (
+            {'id': 'policy-3', 'lifecycle_state': 'stable'},
+            [],
+            'warning', lambda score: score == 60, ['No backup jobs found']
+        )
+    ], ids=['healthy', 'critical', 'no_jobs'])
+    def test_analyze_backup_policy_health(self, policy, jobs, expected_status,
+                                          score_check, expected_issues):
+        """Test backup policy health analysis for healthy, critical and job-less policies"""
         result = analyze_backup_policy_health(policy, jobs)
         
-        assert result['status'] == 'critical'
-        assert result['health_score'] < 60
-        assert any('failed state' in issue for issue in result['issues'])
-        assert any('failure rate' in issue for issue in result['issues'])
+        assert result['status'] == expected_status
+        assert score_check(result['health_score'])
+        if not expected_issues:
+            assert result['issues'] == []
+        for expected in expected_issues:
+            assert any(expected in issue for issue in result['issues'])
     
-    def test_analyze_backup_policy_health_no_jobs(self):
-        """Test backup policy health analysis with no jobs"""
-        policy = {
-            'id': 'policy-3',
-            'lifecycle_state': 'stable'
-        }
+    def test_analyze_backup_policy_health_no_jobs_recommendation(self):
+        """Test that a policy without jobs gets a schedule recommendation"""
+        result = analyze_backup_policy_health({'id': 'policy-3', 'lifecycle_state': 'stable'}, [])
         
-        jobs = []
+        assert any('Verify that backup schedules are active' in rec for rec in result['recommendations'])
+    
+    def test_analyze_backup_policy_health_uses_given_now(self):
+        """Test that job age and the analysis timestamp are measured from the caller's `now`"""
+        jobs = backup_jobs('succeeded', 5)
+        later = datetime.now(timezone.utc) + timedelta(days=10)
         
-        result = analyze_backup_policy_health(policy, jobs)
+        result = analyze_backup_policy_health({'id': 'policy-4', 'lifecycle_state': 'stable'}, jobs, now=later)
         
-        assert result['status'] == 'warning'
-        assert 'No backup jobs found' in result['issues']
-        assert 'Verify that backup schedules are active' in result['recommendations']
+        assert 'Last backup job was 10 days ago' in result['issues']
+        assert result['analysis_timestamp'] == later.isoformat()
 
 
 @pytest.fixture
@@ -496,46 +1213,54 @@ def sample_security_group_data():
 class TestIntegrationScenarios:
     """Integration test scenarios"""
     
-    @pytest.mark.asyncio
-    async def test_full_vpc_analysis_workflow(self, sample_vpc_data):
+    @pytest.mark.slow
+    async def test_full_vpc_analysis_workflow(self, mock_authenticator, monkeypatch, sample_vpc_data):
         """Test a complete VPC analysis workflow"""
-        authenticator = Mock(spec=IAMAuthenticator)
-        manager = VPCManager(authenticator)
+        manager = VPCManager(mock_authenticator)
         
-        # Mock the service calls
-        with patch.object(manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            
-            # Setup mock responses
-            mock_service.list_vpcs.return_value.get_result.return_value = sample_vpc_data
-            mock_service.list_subnets.return_value.get_result.return_value = {'subnets': []}
-            mock_service.list_instances.return_value.get_result.return_value = {'instances': []}
-            
-            # Test the workflow
-            vpcs = await manager.list_vpcs('us-south')
-            assert vpcs['count'] == 2
+        # Stub the service calls
+        mock_service = stub_service(
+            list_vpcs=sample_vpc_data,
+            list_subnets={'subnets': []},
+            list_instances={'instances': []}
+        )
+        
+        monkeypatch.setattr(manager, '_get_vpc_client', lambda region: mock_service)
+        # Test the workflow
+        vpcs = await manager.list_vpcs('us-south')
+        assert vpcs['count'] == 2
+        
+        for vpc in vpcs['vpcs']:
+            subnets = await manager.list_subnets('us-south', vpc['id'])
+            instances = await manager.list_instances('us-south', vpc['id'])
             
-            for vpc in vpcs['vpcs']:
-                subnets = await manager.list_subnets('us-south', vpc['id'])
-                instances = await manager.list_instances('us-south', vpc['id'])
-                
-                assert 'subnets' in subnets
-                assert 'instances' in instances
+            assert 'subnets' in subnets
+            assert 'instances' in instances
 
 
 class TestVPNMethods:
     """Test cases for VPN-related methods"""
     
-    @pytest.fixture
-    def mock_authenticator(self):
-        """Create a mock IAM authenticator"""
-        return Mock(spec=IAMAuthenticator)
+    @staticmethod
+    def _assert_envelope(result, *, region='us-south', **expected):
+        """Assert the region tag and any top-level fields of a VPN method result"""
+        for key, value in expected.items():
+            assert result[key] == value, f"{key}: {result[key]!r} != {value!r}"
+        assert result['region'] == region
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def patched_vpc_client(cls, vpc_service_mock):
+        """Patch VPCManager._get_vpc_client once for the whole class with the shared mock service"""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(VPCManager, '_get_vpc_client', lambda self, region: vpc_service_mock)
+            yield vpc_service_mock
     
     @pytest.fixture
-    def vpc_manager(self, mock_authenticator):
-        """Create a VPCManager instance with mocked authenticator"""
-        return VPCManager(mock_authenticator)
+    def mock_service(self, patched_vpc_client):
+        """Hand each test the shared mock service with all configuration and calls cleared"""
+        patched_vpc_client.reset_mock(return_value=True, side_effect=True)
+        return patched_vpc_client
     
     @pytest.fixture
     def sample_vpn_gateway_data(self):
@@ -585,43 +1310,30 @@ class TestVPNMethods:
             ]
         }
     
-    @pytest.mark.asyncio
-    async def test_list_vpn_gateways(self, vpc_manager, sample_vpn_gateway_data):
+    async def test_list_vpn_gateways(self, vpc_manager, mock_service, sample_vpn_gateway_data):
         """Test listing VPN gateways"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_gateways.return_value.get_result.return_value = sample_vpn_gateway_data
-            
-            result = await vpc_manager.list_vpn_gateways('us-south')
-            
-            assert result['count'] == 2
-            assert result['region'] == 'us-south'
-            assert result['vpc_id'] is None
-            assert len(result['vpn_gateways']) == 2
-            assert result['vpn_gateways'][0]['id'] == 'vpn-gateway-1'
-            assert result['vpn_gateways'][0]['region'] == 'us-south'
-            
-            mock_service.list_vpn_gateways.assert_called_once_with(limit=50)
+        mock_service.list_vpn_gateways.return_value.get_result.return_value = sample_vpn_gateway_data
+        
+        result = await vpc_manager.list_vpn_gateways('us-south')
+        
+        self._assert_envelope(result, count=2, vpc_id=None)
+        assert len(result['vpn_gateways']) == 2
+        assert result['vpn_gateways'][0]['id'] == 'vpn-gateway-1'
+        assert result['vpn_gateways'][0]['region'] == 'us-south'
+        
+        mock_service.list_vpn_gateways.assert_called_once_with(limit=50)
     
-    @pytest.mark.asyncio
-    async def test_list_vpn_gateways_with_vpc_filter(self, vpc_manager, sample_vpn_gateway_data):
+    async def test_list_vpn_gateways_with_vpc_filter(self, vpc_manager, mock_service, sample_vpn_gateway_data):
         """Test listing VPN gateways with VPC filtering"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_gateways.return_value.get_result.return_value = sample_vpn_gateway_data
-            
-            result = await vpc_manager.list_vpn_gateways('us-south', vpc_id='vpc-1')
-            
-            assert result['count'] == 1
-            assert result['region'] == 'us-south'
-            assert result['vpc_id'] == 'vpc-1'
-            assert len(result['vpn_gateways']) == 1
-            assert result['vpn_gateways'][0]['vpc']['id'] == 'vpc-1'
-    
-    @pytest.mark.asyncio
-    async def test_get_vpn_gateway(self, vpc_manager):
+        mock_service.list_vpn_gateways.return_value.get_result.return_value = sample_vpn_gateway_data
+        
+        result = await vpc_manager.list_vpn_gateways('us-south', vpc_id='vpc-1')
+        
+        self._assert_envelope(result, count=1, vpc_id='vpc-1')
+        assert len(result['vpn_gateways']) == 1
+        assert result['vpn_gateways'][0]['vpc']['id'] == 'vpc-1'
+    
+    async def test_get_vpn_gateway(self, vpc_manager, mock_service):
         """Test getting a specific VPN gateway"""
         gateway_data = {
             'id': 'vpn-gateway-1',
@@ -630,53 +1342,38 @@ class TestVPNMethods:
             'vpc': {'id': 'vpc-1', 'name': 'main-vpc'}
         }
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_gateway.return_value.get_result.return_value = gateway_data
-            
-            result = await vpc_manager.get_vpn_gateway('vpn-gateway-1', 'us-south')
-            
-            assert result['id'] == 'vpn-gateway-1'
-            assert result['region'] == 'us-south'
-            
-            mock_service.get_vpn_gateway.assert_called_once_with('vpn-gateway-1')
+        mock_service.get_vpn_gateway.return_value.get_result.return_value = gateway_data
+        
+        result = await vpc_manager.get_vpn_gateway('vpn-gateway-1', 'us-south')
+        
+        self._assert_envelope(result, id='vpn-gateway-1')
+        
+        mock_service.get_vpn_gateway.assert_called_once_with('vpn-gateway-1')
     
-    @pytest.mark.asyncio
-    async def test_list_vpn_servers(self, vpc_manager, sample_vpn_server_data):
+    async def test_list_vpn_servers(self, vpc_manager, mock_service, sample_vpn_server_data):
         """Test listing VPN servers"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_servers.return_value.get_result.return_value = sample_vpn_server_data
-            
-            result = await vpc_manager.list_vpn_servers('us-south')
-            
-            assert result['count'] == 2
-            assert result['region'] == 'us-south'
-            assert len(result['vpn_servers']) == 2
-            assert result['vpn_servers'][0]['id'] == 'vpn-server-1'
-            assert result['vpn_servers'][0]['region'] == 'us-south'
-            
-            mock_service.list_vpn_servers.assert_called_once_with(limit=50)
+        mock_service.list_vpn_servers.return_value.get_result.return_value = sample_vpn_server_data
+        
+        result = await vpc_manager.list_vpn_servers('us-south')
+        
+        self._assert_envelope(result, count=2)
+        assert len(result['vpn_servers']) == 2
+        assert result['vpn_servers'][0]['id'] == 'vpn-server-1'
+        assert result['vpn_servers'][0]['region'] == 'us-south'
+        
+        mock_service.list_vpn_servers.assert_called_once_with(limit=50)
     
-    @pytest.mark.asyncio
-    async def test_list_vpn_servers_with_name_filter(self, vpc_manager, sample_vpn_server_data):
+    async def test_list_vpn_servers_with_name_filter(self, vpc_manager, mock_service, sample_vpn_server_data):
         """Test listing VPN servers with name filtering"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_servers.return_value.get_result.return_value = sample_vpn_server_data
-            
-            result = await vpc_manager.list_vpn_servers('us-south', name='client-access-server')
-            
-            assert result['count'] == 2
-            assert result['region'] == 'us-south'
-            
-            mock_service.list_vpn_servers.assert_called_once_with(limit=50, name='client-access-server')
+        mock_service.list_vpn_servers.return_value.get_result.return_value = sample_vpn_server_data
+        
+        result = await vpc_manager.list_vpn_servers('us-south', name='client-access-server')
+        
+        self._assert_envelope(result, count=2)
+        
+        mock_service.list_vpn_servers.assert_called_once_with(limit=50, name='client-access-server')
     
-    @pytest.mark.asyncio
-    async def test_get_vpn_server(self, vpc_manager):
+    async def test_get_vpn_server(self, vpc_manager, mock_service):
         """Test getting a specific VPN server"""
         server_data = {
             'id': 'vpn-server-1',
@@ -685,20 +1382,15 @@ class TestVPNMethods:
             'client_ip_pool': '192.168.1.0/24'
         }
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_server.return_value.get_result.return_value = server_data
-            
-            result = await vpc_manager.get_vpn_server('vpn-server-1', 'us-south')
-            
-            assert result['id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            
-            mock_service.get_vpn_server.assert_called_once_with('vpn-server-1')
+        mock_service.get_vpn_server.return_value.get_result.return_value = server_data
+        
+        result = await vpc_manager.get_vpn_server('vpn-server-1', 'us-south')
+        
+        self._assert_envelope(result, id='vpn-server-1')
+        
+        mock_service.get_vpn_server.assert_called_once_with('vpn-server-1')
 
-    @pytest.mark.asyncio
-    async def test_get_vpn_server_with_authentication(self, vpc_manager):
+    async def test_get_vpn_server_with_authentication(self, vpc_manager, mock_service):
         """Test getting a VPN server with authentication information"""
         server_data = {
             'id': 'vpn-server-1',
@@ -715,98 +1407,50 @@ class TestVPNMethods:
             ]
         }
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_server.return_value.get_result.return_value = server_data
-            
-            result = await vpc_manager.get_vpn_server('vpn-server-1', 'us-south')
-            
-            assert result['id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            assert 'authentication_summary' in result
-            assert result['authentication_summary']['certificate_based']['enabled'] == True
-            assert result['authentication_summary']['client_authentication'] == [
-                {'method': 'certificate'},
-                {'method': 'username'}
-            ]
-            
-            mock_service.get_vpn_server.assert_called_once_with('vpn-server-1')
+        mock_service.get_vpn_server.return_value.get_result.return_value = server_data
+        
+        result = await vpc_manager.get_vpn_server('vpn-server-1', 'us-south')
+        
+        self._assert_envelope(result, id='vpn-server-1')
+        assert 'authentication_summary' in result
+        assert result['authentication_summary']['certificate_based']['enabled'] == True
+        assert result['authentication_summary']['client_authentication'] == [
+            {'method': 'certificate'},
+            {'method': 'username'}
+        ]
+        
+        mock_service.get_vpn_server.assert_called_once_with('vpn-server-1')
     
-    @pytest.mark.asyncio
-    async def test_vpn_gateway_api_exception(self, vpc_manager):
+    async def test_vpn_gateway_api_exception(self, vpc_manager, mock_service):
         """Test VPN gateway API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_gateways.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.list_vpn_gateways('us-south')
+        mock_service.list_vpn_gateways.side_effect = ApiException('Not Found')
+        
+        with pytest.raises(ApiException):
+            await vpc_manager.list_vpn_gateways('us-south')
     
-    @pytest.mark.asyncio 
-    async def test_vpn_server_api_exception(self, vpc_manager):
+    async def test_vpn_server_api_exception(self, vpc_manager, mock_service):
         """Test VPN server API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_servers.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.list_vpn_servers('us-south')
-
-    @pytest.mark.asyncio
-    async def test_get_ike_policy(self, vpc_manager):
-        """Test getting a specific IKE policy"""
-        ike_policy_data = {
-            'id': 'ike-policy-1',
-            'name': 'main-ike-policy',
-            'authentication_algorithm': 'sha1',
-            'encryption_algorithm': 'aes128',
-            'dh_group': 2,
-            'ike_version': 1
-        }
+        mock_service.list_vpn_servers.side_effect = ApiException('Not Found')
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_ike_policy.return_value.get_result.return_value = ike_policy_data
-            
-            result = await vpc_manager.get_ike_policy('ike-policy-1', 'us-south')
-            
-            assert result['id'] == 'ike-policy-1'
-            assert result['region'] == 'us-south'
-            assert result['authentication_algorithm'] == 'sha1'
-            
-            mock_service.get_ike_policy.assert_called_once_with('ike-policy-1')
+        with pytest.raises(ApiException):
+            await vpc_manager.list_vpn_servers('us-south')
 
-    @pytest.mark.asyncio
-    async def test_get_ipsec_policy(self, vpc_manager):
-        """Test getting a specific IPsec policy"""
-        ipsec_policy_data = {
-            'id': 'ipsec-policy-1',
-            'name': 'main-ipsec-policy',
-            'authentication_algorithm': 'sha1',
-            'encryption_algorithm': 'aes128',
-            'pfs': 'group_2',
-            'protocol': 'esp'
-        }
+    @pytest.mark.parametrize("attr,resource_id,payload,specific_key", [
+        ('get_ike_policy', 'ike-policy-1', _IKE_POLICY, 'authentication_algorithm'),
+        ('get_ipsec_policy', 'ipsec-policy-1', _IPSEC_POLICY, 'protocol'),
+    ])
+    async def test_get_vpn_policy(self, vpc_manager, mock_service, attr, resource_id, payload, specific_key):
+        """Test getting a specific IKE or IPsec policy"""
+        getattr(mock_service, attr).return_value.get_result.return_value = thaw(payload)
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_ipsec_policy.return_value.get_result.return_value = ipsec_policy_data
-            
-            result = await vpc_manager.get_ipsec_policy('ipsec-policy-1', 'us-south')
-            
-            assert result['id'] == 'ipsec-policy-1'
-            assert result['region'] == 'us-south'
-            assert result['protocol'] == 'esp'
-            
-            mock_service.get_ipsec_policy.assert_called_once_with('ipsec-policy-1')
+        result = await getattr(vpc_manager, attr)(resource_id, 'us-south')
+        
+        self._assert_envelope(result, id=resource_id)
+        assert result[specific_key] == payload[specific_key]
+        
+        getattr(mock_service, attr).assert_called_once_with(resource_id)
 
-    @pytest.mark.asyncio
-    async def test_get_vpn_server_client_configuration(self, vpc_manager):
+    async def test_get_vpn_server_client_configuration(self, vpc_manager, mock_service):
         """Test getting VPN server client configuration"""
         # API returns a string containing the OpenVPN configuration file content
         config_content = """client
@@ -818,229 +1462,84 @@ key client.key
 ca ca.crt
 """
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_server_client_configuration.return_value.get_result.return_value = config_content
-            
-            result = await vpc_manager.get_vpn_server_client_configuration('vpn-server-1', 'us-south')
-            
-            assert result['vpn_server_id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            assert 'client_configuration_content' in result
-            assert 'metadata' in result
-            assert result['client_configuration_content'] == config_content
-            assert result['metadata']['content_type'] == 'openvpn_configuration'
-            assert result['metadata']['encoding'] == 'utf-8'
-            
-            mock_service.get_vpn_server_client_configuration.assert_called_once_with('vpn-server-1')
+        mock_service.get_vpn_server_client_configuration.return_value.get_result.return_value = config_content
+        
+        result = await vpc_manager.get_vpn_server_client_configuration('vpn-server-1', 'us-south')
+        
+        self._assert_envelope(result, vpn_server_id='vpn-server-1')
+        assert 'client_configuration_content' in result
+        assert 'metadata' in result
+        assert result['client_configuration_content'] == config_content
+        assert result['metadata']['content_type'] == 'openvpn_configuration'
+        assert result['metadata']['encoding'] == 'utf-8'
+        
+        mock_service.get_vpn_server_client_configuration.assert_called_once_with('vpn-server-1')
 
-    @pytest.mark.asyncio
-    async def test_get_vpn_server_client_configuration_with_binary_data(self, vpc_manager):
+    async def test_get_vpn_server_client_configuration_with_binary_data(self, vpc_manager, mock_service):
         """Test getting VPN server client configuration with binary data handling"""
         # Simulate binary response that needs base64 encoding
-        config_binary = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'  # Binary data that can't be decoded as UTF-8
+        mock_service.get_vpn_server_client_configuration.return_value.get_result.return_value = PNG_BYTES
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_server_client_configuration.return_value.get_result.return_value = config_binary
-            
-            result = await vpc_manager.get_vpn_server_client_configuration('vpn-server-1', 'us-south')
-            
-            assert result['vpn_server_id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            assert 'client_configuration_content' in result
-            assert result['metadata']['encoding'] == 'base64'
-            # Should be base64 encoded
-            import base64
-            expected_content = base64.b64encode(config_binary).decode('ascii')
-            assert result['client_configuration_content'] == expected_content
-            
-            mock_service.get_vpn_server_client_configuration.assert_called_once_with('vpn-server-1')
-
-    @pytest.mark.asyncio
-    async def test_list_vpn_server_routes(self, vpc_manager):
-        """Test listing VPN server routes"""
-        routes_data = {
-            'routes': [
-                {
-                    'id': 'route-1',
-                    'name': 'main-route',
-                    'destination': '10.0.0.0/24',
-                    'action': 'translate'
-                },
-                {
-                    'id': 'route-2',
-                    'name': 'secondary-route', 
-                    'destination': '192.168.0.0/16',
-                    'action': 'translate'
-                }
-            ]
-        }
+        result = await vpc_manager.get_vpn_server_client_configuration('vpn-server-1', 'us-south')
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_routes.return_value.get_result.return_value = routes_data
-            
-            result = await vpc_manager.list_vpn_server_routes('vpn-server-1', 'us-south')
-            
-            assert result['vpn_server_id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            assert result['count'] == 2
-            assert len(result['routes']) == 2
-            assert result['routes'][0]['id'] == 'route-1'
-            assert result['routes'][0]['region'] == 'us-south'
-            
-            mock_service.list_vpn_server_routes.assert_called_once_with('vpn-server-1', limit=50)
-
-    @pytest.mark.asyncio
-    async def test_list_vpn_server_routes_with_pagination(self, vpc_manager):
-        """Test listing VPN server routes with pagination"""
-        routes_data = {'routes': []}
-        
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_routes.return_value.get_result.return_value = routes_data
-            
-            result = await vpc_manager.list_vpn_server_routes('vpn-server-1', 'us-south', limit=25, start='next-token')
-            
-            assert result['count'] == 0
-            mock_service.list_vpn_server_routes.assert_called_once_with('vpn-server-1', limit=25, start='next-token')
-
-    @pytest.mark.asyncio
-    async def test_ike_policy_api_exception(self, vpc_manager):
-        """Test IKE policy API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_ike_policy.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.get_ike_policy('ike-policy-1', 'us-south')
-
-    @pytest.mark.asyncio
-    async def test_ipsec_policy_api_exception(self, vpc_manager):
-        """Test IPsec policy API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_ipsec_policy.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.get_ipsec_policy('ipsec-policy-1', 'us-south')
-
-    @pytest.mark.asyncio
-    async def test_vpn_server_client_configuration_api_exception(self, vpc_manager):
-        """Test VPN server client configuration API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.get_vpn_server_client_configuration.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.get_vpn_server_client_configuration('vpn-server-1', 'us-south')
-
-    @pytest.mark.asyncio
-    async def test_vpn_server_routes_api_exception(self, vpc_manager):
-        """Test VPN server routes API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_routes.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.list_vpn_server_routes('vpn-server-1', 'us-south')
+        self._assert_envelope(result, vpn_server_id='vpn-server-1')
+        assert 'client_configuration_content' in result
+        assert result['metadata']['encoding'] == 'base64'
+        # Should be base64 encoded
+        assert result['client_configuration_content'] == EXPECTED_PNG_B64
+        
+        mock_service.get_vpn_server_client_configuration.assert_called_once_with('vpn-server-1')
 
-    @pytest.mark.asyncio
-    async def test_list_vpn_server_clients(self, vpc_manager):
-        """Test listing VPN server clients"""
-        clients_data = {
-            'clients': [
-                {
-                    'id': 'client-1',
-                    'common_name': 'user1.example.com',
-                    'username': 'user1',
-                    'status': 'connected',
-                    'client_ip': '10.240.0.4',
-                    'created_at': '2023-01-01T00:00:00Z',
-                    'connected_at': '2023-01-01T10:00:00Z'
-                },
-                {
-                    'id': 'client-2',
-                    'common_name': 'user2.example.com',
-                    'username': 'user2',
-                    'status': 'disconnected',
-                    'client_ip': '10.240.0.5',
-                    'created_at': '2023-01-02T00:00:00Z'
-                }
-            ],
-            'total_count': 2,
-            'limit': 50
-        }
+    @pytest.mark.parametrize("call_kwargs,payload", [
+        ({}, _ROUTES_DATA),
+        ({'limit': 25, 'start': 'next-token'}, MappingProxyType({'routes': ()})),
+    ], ids=['defaults', 'pagination'])
+    async def test_list_vpn_server_routes(self, vpc_manager, mock_service, call_kwargs, payload):
+        """Test listing VPN server routes with default and explicit pagination"""
+        mock_service.list_vpn_server_routes.return_value.get_result.return_value = thaw(payload)
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_clients.return_value.get_result.return_value = clients_data
-            
-            result = await vpc_manager.list_vpn_server_clients('vpn-server-1', 'us-south')
-            
-            assert result['vpn_server_id'] == 'vpn-server-1'
-            assert result['region'] == 'us-south'
-            assert result['count'] == 2
-            assert result['total_count'] == 2
-            assert len(result['clients']) == 2
-            assert result['clients'][0]['id'] == 'client-1'
-            assert result['clients'][0]['region'] == 'us-south'
-            assert result['clients'][0]['vpn_server_id'] == 'vpn-server-1'
-            assert result['clients'][0]['status'] == 'connected'
-            
-            mock_service.list_vpn_server_clients.assert_called_once_with('vpn-server-1', limit=50)
+        result = await vpc_manager.list_vpn_server_routes('vpn-server-1', 'us-south', **call_kwargs)
+        
+        self._assert_envelope(result, vpn_server_id='vpn-server-1', count=len(payload['routes']))
+        assert [route['id'] for route in result['routes']] == [route['id'] for route in payload['routes']]
+        assert all(route['region'] == 'us-south' for route in result['routes'])
+        
+        mock_service.list_vpn_server_routes.assert_called_once_with('vpn-server-1', **{'limit': 50, **call_kwargs})
 
-    @pytest.mark.asyncio
-    async def test_list_vpn_server_clients_with_pagination_and_sort(self, vpc_manager):
-        """Test listing VPN server clients with pagination and sort"""
-        clients_data = {
-            'clients': [
-                {
-                    'id': 'client-3',
-                    'common_name': 'user3.example.com',
-                    'username': 'user3',
-                    'status': 'connected',
-                    'created_at': '2023-01-03T00:00:00Z'
-                }
-            ],
-            'total_count': 1,
-            'limit': 25
-        }
+    @pytest.mark.parametrize("method_name,args", [
+        ('get_ike_policy', ('ike-policy-1', 'us-south')),
+        ('get_ipsec_policy', ('ipsec-policy-1', 'us-south')),
+        ('get_vpn_server_client_configuration', ('vpn-server-1', 'us-south')),
+        ('list_vpn_server_routes', ('vpn-server-1', 'us-south')),
+        ('list_vpn_server_clients', ('vpn-server-1', 'us-south')),
+    ])
+    async def test_vpn_detail_api_exception(self, vpc_manager, mock_service, method_name, args):
+        """Test API exception handling for the VPN policy and server detail methods"""
+        getattr(mock_service, method_name).side_effect = ApiException('Not Found')
         
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_clients.return_value.get_result.return_value = clients_data
-            
-            result = await vpc_manager.list_vpn_server_clients(
-                'vpn-server-1', 'us-south', limit=25, start='next-token', sort='created_at'
-            )
-            
-            assert result['count'] == 1
-            assert result['total_count'] == 1
-            assert result['limit'] == 25
-            
-            mock_service.list_vpn_server_clients.assert_called_once_with(
-                'vpn-server-1', limit=25, start='next-token', sort='created_at'
-            )
+        with pytest.raises(ApiException):
+            await getattr(vpc_manager, method_name)(*args)
 
-    @pytest.mark.asyncio
-    async def test_list_vpn_server_clients_api_exception(self, vpc_manager):
-        """Test VPN server clients API exception handling"""
-        with patch.object(vpc_manager, '_get_vpc_client') as mock_get_client:
-            mock_service = Mock()
-            mock_get_client.return_value = mock_service
-            mock_service.list_vpn_server_clients.side_effect = ApiException('Not Found')
-            
-            with pytest.raises(ApiException):
-                await vpc_manager.list_vpn_server_clients('vpn-server-1', 'us-south')
+    @pytest.mark.parametrize("call_kwargs,payload", [
+        ({}, _CLIENTS_DATA),
+        ({'limit': 25, 'start': 'next-token', 'sort': 'created_at'}, _CLIENTS_PAGE_DATA),
+    ], ids=['defaults', 'pagination_and_sort'])
+    async def test_list_vpn_server_clients(self, vpc_manager, mock_service, call_kwargs, payload):
+        """Test listing VPN server clients with default and explicit pagination and sort"""
+        mock_service.list_vpn_server_clients.return_value.get_result.return_value = thaw(payload)
+        
+        result = await vpc_manager.list_vpn_server_clients('vpn-server-1', 'us-south', **call_kwargs)
+        
+        self._assert_envelope(
+            result,
+            vpn_server_id='vpn-server-1',
+            count=len(payload['clients']),
+            total_count=payload['total_count'],
+            limit=payload['limit']
+        )
+        assert [client['id'] for client in result['clients']] == [client['id'] for client in payload['clients']]
+        assert [client['status'] for client in result['clients']] == [client['status'] for client in payload['clients']]
+        assert all(client['region'] == 'us-south' for client in result['clients'])
+        assert all(client['vpn_server_id'] == 'vpn-server-1' for client in result['clients'])
+        
+        mock_service.list_vpn_server_clients.assert_called_once_with('vpn-server-1', **{'limit': 50, **call_kwargs})
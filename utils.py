@@ -3,24 +3,470 @@ IBM Cloud VPC Utilities
 Provides VPC resource management functionality for IBM Cloud
 """
 
+import asyncio
+import base64
+import bisect
+import contextvars
+import functools
+import hashlib
+import ipaddress
+import json
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse
 
 import ibm_vpc
-from ibm_cloud_sdk_core import ApiException
+import requests
+from ibm_cloud_sdk_core import ApiException, get_query_param
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from urllib3.util.retry import Retry
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the SDK's stdlib JSON parsing
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _orjson_response_hook(response, *args, **kwargs):
+    """requests response hook that parses JSON bodies with orjson, falling back to the stdlib parser"""
+    stdlib_json = response.json
+    
+    def _json(**json_kwargs):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejects control characters the SDK allows via strict=False
+            return stdlib_json(**json_kwargs)
+    
+    response.json = _json
+    return response
+
+
+class _RegionThrottledAdapter(SSLHTTPAdapter):
+    """SDK SSL adapter that caps in-flight requests per regional endpoint host
+
+    Regional calls run in worker threads, so the cap is a thread semaphore around send().
+    """
+    
+    def __init__(self, *args, max_per_host: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._max_per_host = max_per_host
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+    
+    def send(self, request, *args, **kwargs):
+        host = urlparse(request.url).hostname
+        with self._host_slots_lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = self._host_slots[host] = threading.BoundedSemaphore(self._max_per_host)
+        with slots:
+            return super().send(request, *args, **kwargs)
+
+
+# SDK calls wait on the network, not the CPU, so give them a pool sized to the request budget
+# rather than the default executor's min(32, cpu_count + 4) workers
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix='vpc-api')
+
+
+async def _call_api(method, *args, **kwargs) -> Any:
+    """Run a synchronous VPC SDK call in an API worker thread and return its result body"""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, lambda: method(*args, **kwargs).get_result())
+    return await loop.run_in_executor(_API_EXECUTOR, call)
+
+
+# Largest page size the VPC list APIs accept; fewer, fuller pages mean fewer cursor round-trips
+_MAX_PAGE_LIMIT = 100
+
+
+async def _fetch_all_pages(method, collection: str, transform=None, **params) -> List[Dict[str, Any]]:
+    """Follow `next` cursors of a paginated VPC list call, fetching each page while the previous one is consumed
+
+    If `transform` is given, each item is projected as its page arrives so raw pages can be released early.
+    """
+    items = []
+    pending = asyncio.ensure_future(_call_api(method, **params))
+    try:
+        while pending is not None:
+            page = await pending
+            next_href = (page.get('next') or {}).get('href')
+            next_start = get_query_param(next_href, 'start') if next_href else None
+            pending = asyncio.ensure_future(_call_api(method, **{**params, 'start': next_start})) if next_start else None
+            page_items = page.get(collection, [])
+            items.extend(map(transform, page_items) if transform else page_items)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+    return items
+
+
+# (field, default) projections for routing table payloads; dict defaults are shared and never mutated
+_RT_FIELDS = (
+    ('id', 'unknown'),
+    ('name', 'unknown'),
+    ('vpc', {}),
+    ('is_default', False),
+    ('lifecycle_state', 'unknown'),
+    ('resource_group', {}),
+    ('created_at', 'unknown'),
+    ('href', 'unknown'),
+    ('route_direct_link_ingress', False),
+    ('route_transit_gateway_ingress', False),
+    ('route_vpc_zone_ingress', False)
+)
+_RT_SUBNET_FIELDS = (('id', 'unknown'), ('name', 'unknown'), ('href', 'unknown'))
+_RT_ROUTE_FIELDS = (
+    ('id', 'unknown'),
+    ('name', 'unknown'),
+    ('destination', 'unknown'),
+    ('action', 'unknown'),
+    ('zone', {}),
+    ('created_at', 'unknown'),
+    ('href', 'unknown'),
+    ('lifecycle_state', 'unknown')
+)
+
+
+def _project(item: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """Copy the given (field, default) pairs out of an API payload"""
+    get = item.get
+    return {key: get(key, default) for key, default in fields}
+
+
+def _summarize_routing_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a raw routing table onto the fields returned by the routing table tools"""
+    table_info = _project(table, _RT_FIELDS)
+    
+    # Add subnets if present
+    if table.get('subnets'):
+        table_info['subnets'] = [_project(subnet, _RT_SUBNET_FIELDS) for subnet in table['subnets']]
+    
+    # Add routes count if present
+    if 'routes' in table:
+        table_info['routes_count'] = len(table['routes'])
+    
+    return table_info
+
+
+def _rule_covers_port(rule: Dict[str, Any], port: int) -> bool:
+    """Return True if a rule's port range includes `port`; a missing bound leaves that side open"""
+    port_min = rule.get('port_min')
+    port_max = rule.get('port_max')
+    return (port_min is None or port_min <= port) and (port_max is None or port <= port_max)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_network(cidr: Optional[str]):
+    """Parse a CIDR block into an ip_network, or None if it isn't one; cached since rules repeat CIDRs"""
+    try:
+        return ipaddress.ip_network(cidr, strict=False)
+    except (TypeError, ValueError):
+        return None
+
+
+def _remote_covers(remote: Any, source_cidr: str, target) -> bool:
+    """Return True if a rule's remote CIDR admits all of `source_cidr` (equal to it or a supernet of it)"""
+    if not isinstance(remote, dict):
+        return False
+    cidr = remote.get('cidr_block')
+    network = _parse_network(cidr)
+    if network is None or target is None:
+        return cidr == source_cidr
+    return network.version == target.version and network.supernet_of(target)
+
+
+def _make_rule_predicate(protocol: str, port: Optional[int], source_cidr: str):
+    """Build a predicate matching inbound rules for `protocol` that admit `source_cidr`, covering `port` if given"""
+    target = _parse_network(source_cidr)
+    
+    def predicate(rule: Dict[str, Any]) -> bool:
+        get = rule.get
+        # Direction first: it is the cheapest check and rejects every outbound rule
+        if get('direction') != 'inbound' or get('protocol') != protocol:
+            return False
+        if port is not None and not _rule_covers_port(rule, port):
+            return False
+        return _remote_covers(get('remote', {}), source_cidr, target)
+    
+    return predicate
+
+
+# SSH access from anywhere: inbound TCP from 0.0.0.0/0 with port 22 in range
+_is_ssh_from_anywhere = _make_rule_predicate('tcp', 22, '0.0.0.0/0')
+
+
+def _summarize_instance(instance: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a raw instance onto the fields returned by list_instances"""
+    primary_interface = instance['primary_network_interface']
+    return {
+        'id': instance['id'],
+        'name': instance['name'],
+        'status': instance['status'],
+        'profile': instance['profile']['name'],
+        'vpc': instance['vpc'],
+        'zone': instance['zone']['name'],
+        'primary_network_interface': {
+            'id': primary_interface['id'],
+            'primary_ipv4_address': primary_interface.get('primary_ipv4_address')
+        },
+        'created_at': instance['created_at']
+    }
+
+
+def _compose_backup_policy_summary(backup_policy_id: str, region: str, now: datetime,
+                                   policy: Any, plans_data: Any, jobs_data: Any) -> Dict[str, Any]:
+    """Build a backup policy summary from its fetched parts; a part that failed is passed as its exception"""
+    summary = {
+        'backup_policy_id': backup_policy_id,
+        'region': region,
+        'timestamp': now.isoformat()
+    }
+    
+    summary['policy_details'] = {'error': str(policy)} if isinstance(policy, Exception) else policy
+    
+    if isinstance(plans_data, Exception):
+        summary['plans'] = {'error': str(plans_data)}
+    else:
+        summary['plans'] = {
+            'count': plans_data['count'],
+            'plans': plans_data['plans']
+        }
+    
+    if isinstance(jobs_data, Exception):
+        summary['recent_jobs'] = {'error': str(jobs_data)}
+    else:
+        summary['recent_jobs'] = {
+            'count': jobs_data['count'],
+            'status_summary': jobs_data['status_summary'],
+            'jobs': jobs_data['jobs'][:10]  # Only include last 10 jobs in summary
+        }
+    
+    return summary
+
+
+def _cache_key(func, args: tuple, kwargs: Dict[str, Any]) -> tuple:
+    """Key a cached call by method and arguments; `refresh` only controls the lookup, so it is left out"""
+    return (func.__name__, args, tuple(sorted(item for item in kwargs.items() if item[0] != 'refresh')))
+
+
+def ttl_cache(ttl: float):
+    """Cache a VPCManager coroutine's result per arguments for `ttl` seconds
+
+    Concurrent misses for the same arguments share one in-flight refresh. For another `ttl` seconds after
+    expiry the stale result is still served while a background task refreshes it, so callers never wait
+    on a refresh of a recently used entry. The cache keeps at most TTL_CACHE_MAXSIZE entries, least
+    recently used first out. Passing refresh=True skips the cached result and refetches.
+    """
+    def decorator(func):
+        async def _refresh(self, key, args, kwargs):
+            value = await func(self, *args, **kwargs)
+            self._ttl_cache[key] = (time.monotonic() + ttl, value)
+            self._ttl_cache.move_to_end(key)
+            while len(self._ttl_cache) > self.TTL_CACHE_MAXSIZE:
+                evicted, _ = self._ttl_cache.popitem(last=False)
+                self._ttl_locks.pop(evicted, None)
+            return value
+        
+        async def _revalidate(self, key, lock, args, kwargs):
+            async with lock:
+                entry = self._ttl_cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return
+                try:
+                    await _refresh(self, key, args, kwargs)
+                except Exception as e:
+                    logger.warning(f"Background refresh of {func.__name__} failed, keeping stale result: {e}")
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = _cache_key(func, args, kwargs)
+            refresh = kwargs.get('refresh', False)
+            entry = None if refresh else self._ttl_cache.get(key)
+            if entry:
+                expiry, value = entry
+                now = time.monotonic()
+                if expiry > now:
+                    self._ttl_cache.move_to_end(key)
+                    self.cache_stats['hits'] += 1
+                    return value
+                if expiry + ttl > now:
+                    lock = self._ttl_locks.setdefault(key, asyncio.Lock())
+                    if not lock.locked():
+                        task = asyncio.ensure_future(_revalidate(self, key, lock, args, kwargs))
+                        self._background_tasks.add(task)
+                        task.add_done_callback(self._background_tasks.discard)
+                    self.cache_stats['stale'] += 1
+                    return value
+            
+            lock = self._ttl_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = self._ttl_cache.get(key)
+                if entry and entry[0] > time.monotonic() and not refresh:
+                    self.cache_stats['hits'] += 1
+                    return entry[1]
+                self.cache_stats['misses'] += 1
+                return await _refresh(self, key, args, kwargs)
+        return wrapper
+    return decorator
+
+
+def _read_disk_entry(path: str) -> Optional[Dict[str, Any]]:
+    """Load a disk cache entry, or None if it is missing, unreadable or expired"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get('expires', 0) <= time.time():
+        return None
+    return entry
+
+
+def _write_disk_entry(path: str, entry: Dict[str, Any]) -> None:
+    """Atomically write a disk cache entry so concurrent processes never read a partial file"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    raw = orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def disk_cache(ttl: float):
+    """Persist a VPCManager coroutine's JSON result per arguments under `self.cache_dir` for `ttl` seconds
+
+    Lets short-lived server processes skip refetching slow-changing catalogs. Does nothing when
+    `cache_dir` is unset; cache read and write failures fall back to calling the API. Passing
+    refresh=True skips the stored result and overwrites it.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not self.cache_dir:
+                return await func(self, *args, **kwargs)
+            
+            key = repr(_cache_key(func, args, kwargs))
+            digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+            path = os.path.join(self.cache_dir, f'{func.__name__}-{digest}.json')
+            if not kwargs.get('refresh', False):
+                entry = await asyncio.to_thread(_read_disk_entry, path)
+                if entry is not None and entry.get('key') == key:
+                    return entry['value']
+            
+            value = await func(self, *args, **kwargs)
+            try:
+                await asyncio.to_thread(_write_disk_entry, path, {'key': key, 'expires': time.time() + ttl, 'value': value})
+            except (OSError, TypeError) as e:
+                logger.debug(f"Could not write disk cache entry {path}: {e}")
+            return value
+        return wrapper
+    return decorator
+
+
+def single_flight(func):
+    """Collapse concurrent identical VPCManager coroutine calls into one in-flight request"""
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(self, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+    return wrapper
+
+
 class VPCManager:
     """Manages IBM Cloud VPC operations"""
     
-    def __init__(self, authenticator: IAMAuthenticator):
+    # Default upper bound on concurrent fan-out requests (per-region listings, per-security-group rules)
+    FAN_OUT_CONCURRENCY = 16
+    
+    # Seconds to wait on any single fan-out request before reporting it as failed
+    FAN_OUT_TIMEOUT = 30
+    
+    # Seconds to reuse individually fetched security group rules, and most groups kept before evicting
+    # the least recently used
+    SG_RULES_TTL = 60
+    SG_RULES_CACHE_MAXSIZE = 2048
+    
+    # Seconds to reuse a region's raw resource list and its VPC index
+    VPC_INDEX_TTL = 30
+    
+    # Keep-alive connection pool sizing shared by all regional clients
+    HTTP_POOL_CONNECTIONS = 64
+    HTTP_POOL_MAXSIZE = 128
+    
+    # Upper bound on in-flight requests per regional endpoint
+    MAX_REQUESTS_PER_REGION = 32
+    
+    # Most results ttl_cache keeps before evicting the least recently used
+    TTL_CACHE_MAXSIZE = 1024
+    
+    # Default upper bound on concurrent per-policy job requests in analyze_backup_policies
+    BACKUP_JOB_FETCH_CONCURRENCY = 8
+    
+    # get_vpc_resources_summary sections that are nested under 'resources'
+    _RESOURCE_SECTIONS = ('subnets', 'instances', 'security_groups', 'public_gateways')
+    # Fixed order of every summary section, whatever order they finish in
+    _SUMMARY_SECTIONS = ('vpc_details',) + _RESOURCE_SECTIONS + ('security_analysis',)
+    
+    def __init__(self, authenticator: IAMAuthenticator, cache_dir: Optional[str] = None,
+                 backup_job_concurrency: Optional[int] = None, max_concurrency: Optional[int] = None):
         self.authenticator = authenticator
+        self.max_concurrency = max_concurrency or self.FAN_OUT_CONCURRENCY
+        self.backup_job_concurrency = backup_job_concurrency or self.BACKUP_JOB_FETCH_CONCURRENCY
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None  # see disk_cache
         self.vpc_clients = {}  # Cache VPC clients by region
         self.regions = []
+        self._ttl_cache = OrderedDict()  # (method, args) -> (expiry, result), see ttl_cache
+        self._ttl_locks = {}
+        self._background_tasks = set()  # stale-while-revalidate refreshes, held so they aren't collected
+        self.cache_stats = {'hits': 0, 'misses': 0, 'stale': 0}
+        self._inflight = {}  # (method, args) -> in-flight task, see single_flight
+        self._sg_rules_cache = OrderedDict()  # (region, security group id) -> (expiry, rules), LRU order
+        self._vpc_index_cache = {}  # (region, collection) -> (expiry, items, items by VPC id)
+        self._token_lock = asyncio.Lock()
+        # One pooled session shared by every regional client; the SDK's SSL adapter keeps its TLS 1.2 floor
+        self.http_adapter = _RegionThrottledAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            # Same retry policy as the SDK's enable_retries(); honors Retry-After on 429s
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                backoff_max=30.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE', 'POST']
+            ),
+            pool_block=False,
+            max_per_host=self.MAX_REQUESTS_PER_REGION
+        )
+        self.http_session = requests.Session()
+        self.http_session.mount('http://', self.http_adapter)
+        self.http_session.mount('https://', self.http_adapter)
+        if orjson is not None:
+            self.http_session.hooks['response'].append(_orjson_response_hook)
 
 
     def _get_vpc_client(self, region: str) -> ibm_vpc.VpcV1:
@@ -31,14 +477,52 @@ class VPCManager:
                 authenticator=self.authenticator
             )
             service.set_service_url(f'https://{region}.iaas.cloud.ibm.com/v1')
+            service.set_http_client(self.http_session)
             self.vpc_clients[region] = service
         return self.vpc_clients[region]
 
-    async def list_regions(self) -> Dict[str, Any]:
-        """List all available regions"""
+    def close(self) -> None:
+        """Close the pooled HTTP session and its connections"""
+        self.http_session.close()
+
+    async def _prime_token(self) -> None:
+        """Make sure an IAM token is cached before fanning out, so parallel first calls don't each wait on IAM"""
+        token_manager = getattr(self.authenticator, 'token_manager', None)
+        if token_manager is None:
+            return
+        async with self._token_lock:
+            # Returns the cached token immediately unless it is missing or due for refresh
+            await asyncio.to_thread(token_manager.get_token)
+    
+    async def _vpc_scoped(self, region: str, collection: str, fetch, vpc_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return a region's `collection` items, optionally only those in `vpc_id`
+
+        `fetch` is a coroutine function returning the raw item list. The list and an index by VPC id
+        are cached per region, so filtering by different VPCs doesn't rescan or refetch.
+        """
+        key = (region, collection)
+        entry = self._vpc_index_cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            items = await fetch()
+            by_vpc = defaultdict(list)
+            for item in items:
+                by_vpc[(item.get('vpc') or {}).get('id')].append(item)
+            entry = self._vpc_index_cache[key] = (time.monotonic() + self.VPC_INDEX_TTL, items, dict(by_vpc))
+        
+        _, items, by_vpc = entry
+        return list(by_vpc.get(vpc_id, ())) if vpc_id else list(items)
+    
+    @disk_cache(7 * 24 * 3600)
+    async def _region_catalog(self, refresh: bool = False) -> Dict[str, Any]:
+        """Fetch the raw region list"""
         # Use us-south to get region list
         service = self._get_vpc_client('us-south')
-        response = service.list_regions().get_result()
+        return await _call_api(service.list_regions)
+    
+    @ttl_cache(3600)
+    async def list_regions(self, refresh: bool = False) -> Dict[str, Any]:
+        """List all available regions; refresh=True bypasses the caches"""
+        response = await self._region_catalog(refresh=refresh)
         
         self.regions = [region['name'] for region in response['regions']]
         
@@ -47,29 +531,62 @@ class VPCManager:
             'count': len(response['regions'])
         }
     
-    async def list_vpcs(self, region: Optional[str] = None) -> Dict[str, Any]:
-        """List VPCs in specified region or all regions"""
-        all_vpcs = []
-        
+    async def _regions_to_check(self, region: Optional[str] = None) -> List[str]:
+        """Return [region] if given, otherwise every known region"""
         if region:
-            regions_to_check = [region]
-        else:
-            # Get all regions if not cached
-            if not self.regions:
-                await self.list_regions()
-            regions_to_check = self.regions
-        
-        for region_name in regions_to_check:
+            return [region]
+        # Get all regions if not cached
+        if not self.regions:
+            await self.list_regions()
+        return self.regions
+    
+    async def iter_vpcs(self, region: Optional[str] = None) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Yield (region, vpcs) for the specified region or all regions, each as soon as its listing completes"""
+        regions_to_check = await self._regions_to_check(region)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _list_region_vpcs(region_name: str) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            service = self._get_vpc_client(region_name)
             try:
-                service = self._get_vpc_client(region_name)
-                response = service.list_vpcs().get_result()
-                
-                for vpc in response['vpcs']:
-                    vpc['region'] = region_name
-                    all_vpcs.append(vpc)
-                    
+                async with semaphore:
+                    vpcs = await asyncio.wait_for(
+                        _fetch_all_pages(service.list_vpcs, 'vpcs', limit=_MAX_PAGE_LIMIT),
+                        self.FAN_OUT_TIMEOUT
+                    )
             except ApiException as e:
                 logger.warning(f"Error listing VPCs in region {region_name}: {e}")
+                return region_name, None
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out listing VPCs in region {region_name} after {self.FAN_OUT_TIMEOUT}s")
+                return region_name, None
+            return region_name, vpcs
+        
+        await self._prime_token()
+        tasks = [asyncio.ensure_future(_list_region_vpcs(region_name)) for region_name in regions_to_check]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                region_name, vpcs = await next_done
+                if vpcs is None:
+                    continue
+                for vpc in vpcs:
+                    vpc['region'] = region_name
+                yield region_name, vpcs
+        finally:
+            # Stop outstanding regions if the consumer bails out early or a region fails
+            for task in tasks:
+                task.cancel()
+    
+    @single_flight
+    async def list_vpcs(self, region: Optional[str] = None) -> Dict[str, Any]:
+        """List VPCs in specified region or all regions"""
+        regions_to_check = await self._regions_to_check(region)
+        
+        vpcs_by_region = {}
+        async for region_name, vpcs in self.iter_vpcs(region):
+            vpcs_by_region[region_name] = vpcs
+        
+        # Report in region order regardless of completion order
+        all_vpcs = [vpc for region_name in regions_to_check for vpc in vpcs_by_region.get(region_name, ())]
         
         return {
             'vpcs': all_vpcs,
@@ -77,30 +594,32 @@ class VPCManager:
             'regions_checked': regions_to_check
         }
     
+    @ttl_cache(300)
     async def get_vpc(self, vpc_id: str, region: str) -> Dict[str, Any]:
         """Get details of a specific VPC"""
         service = self._get_vpc_client(region)
-        vpc = service.get_vpc(id=vpc_id).get_result()
+        vpc = await _call_api(service.get_vpc, id=vpc_id)
         vpc['region'] = region
         return vpc
     
+    @single_flight
     async def list_subnets(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """List subnets in a region, optionally filtered by VPC"""
         service = self._get_vpc_client(region)
-        response = service.list_subnets().get_result()
         
-        subnets = response['subnets']
+        def _add_details(subnet: Dict[str, Any]) -> Dict[str, Any]:
+            subnet['region'] = region
+            subnet.setdefault('available_ipv4_address_count', 0)
+            subnet.setdefault('total_ipv4_address_count', 0)
+            return subnet
         
-        # Filter by VPC if specified
-        if vpc_id:
-            subnets = [s for s in subnets if s['vpc']['id'] == vpc_id]
+        async def _fetch():
+            # Details are added once per page as it arrives, not on every (cached) listing
+            return await _fetch_all_pages(service.list_subnets, 'subnets', transform=_add_details,
+                                          limit=_MAX_PAGE_LIMIT)
+        
+        subnets = await self._vpc_scoped(region, 'subnets', _fetch, vpc_id)
         
-        # Add additional subnet details
-        for subnet in subnets:
-            subnet['region'] = region
-            subnet['available_ipv4_address_count'] = subnet.get('available_ipv4_address_count', 0)
-            subnet['total_ipv4_address_count'] = subnet.get('total_ipv4_address_count', 0)
-            
         return {
             'subnets': subnets,
             'count': len(subnets),
@@ -109,32 +628,16 @@ class VPCManager:
         }
     
     async def list_instances(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
-        """List compute instances"""
+        """List compute instances across all result pages"""
         service = self._get_vpc_client(region)
-        response = service.list_instances().get_result()
-        
-        instances = response['instances']
-        
-        # Filter by VPC if specified
-        if vpc_id:
-            instances = [i for i in instances if i['vpc']['id'] == vpc_id]
-        
-        # Summarize instance data
-        instance_summary = []
-        for instance in instances:
-            instance_summary.append({
-                'id': instance['id'],
-                'name': instance['name'],
-                'status': instance['status'],
-                'profile': instance['profile']['name'],
-                'vpc': instance['vpc'],
-                'zone': instance['zone']['name'],
-                'primary_network_interface': {
-                    'id': instance['primary_network_interface']['id'],
-                    'primary_ipv4_address': instance['primary_network_interface'].get('primary_ipv4_address')
-                },
-                'created_at': instance['created_at']
-            })
+        # Summaries are projected page by page, so only they (not raw instances) are cached
+        instance_summary = await self._vpc_scoped(
+            region,
+            'instances',
+            lambda: _fetch_all_pages(service.list_instances, 'instances', transform=_summarize_instance,
+                                     limit=_MAX_PAGE_LIMIT),
+            vpc_id
+        )
         
         return {
             'instances': instance_summary,
@@ -143,21 +646,21 @@ class VPCManager:
             'vpc_filter': vpc_id
         }
     
-    async def list_instance_profiles(self, region: str) -> Dict[str, Any]:
-        """List available instance profiles"""
+    @ttl_cache(600)
+    @disk_cache(24 * 3600)
+    async def list_instance_profiles(self, region: str, refresh: bool = False) -> Dict[str, Any]:
+        """List available instance profiles; refresh=True bypasses the caches"""
         service = self._get_vpc_client(region)
-        response = service.list_instance_profiles().get_result()
-        
-        profiles = []
-        for profile in response['profiles']:
-            profiles.append({
-                'name': profile['name'],
-                'family': profile.get('family'),
-                'vcpu_count': profile.get('vcpu_count'),
-                'memory': profile.get('memory'),
-                'network_interface_count': profile.get('network_interface_count'),
-                'bandwidth': profile.get('bandwidth')
-            })
+        response = await _call_api(service.list_instance_profiles)
+        
+        profiles = [{
+            'name': profile['name'],
+            'family': profile.get('family'),
+            'vcpu_count': profile.get('vcpu_count'),
+            'memory': profile.get('memory'),
+            'network_interface_count': profile.get('network_interface_count'),
+            'bandwidth': profile.get('bandwidth')
+        } for profile in response['profiles']]
         
         return {
             'profiles': profiles,
@@ -168,13 +671,11 @@ class VPCManager:
     async def list_public_gateways(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """List public gateways"""
         service = self._get_vpc_client(region)
-        response = service.list_public_gateways().get_result()
         
-        gateways = response['public_gateways']
+        async def _fetch():
+            return await _fetch_all_pages(service.list_public_gateways, 'public_gateways', limit=_MAX_PAGE_LIMIT)
         
-        # Filter by VPC if specified
-        if vpc_id:
-            gateways = [g for g in gateways if g['vpc']['id'] == vpc_id]
+        gateways = await self._vpc_scoped(region, 'public_gateways', _fetch, vpc_id)
         
         return {
             'public_gateways': gateways,
@@ -183,27 +684,29 @@ class VPCManager:
             'vpc_filter': vpc_id
         }
     
-    async def list_security_groups(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
-        """List security groups"""
+    @single_flight
+    async def _raw_security_groups(self, region: str, vpc_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return raw security group payloads (with embedded rules) for a region, optionally for one VPC"""
         service = self._get_vpc_client(region)
-        response = service.list_security_groups().get_result()
         
-        security_groups = response['security_groups']
+        async def _fetch():
+            return await _fetch_all_pages(service.list_security_groups, 'security_groups', limit=_MAX_PAGE_LIMIT)
         
-        # Filter by VPC if specified
-        if vpc_id:
-            security_groups = [sg for sg in security_groups if sg['vpc']['id'] == vpc_id]
+        return await self._vpc_scoped(region, 'security_groups', _fetch, vpc_id)
+    
+    @single_flight
+    async def list_security_groups(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
+        """List security groups"""
+        security_groups = await self._raw_security_groups(region, vpc_id)
         
         # Summarize security groups
-        sg_summary = []
-        for sg in security_groups:
-            sg_summary.append({
-                'id': sg['id'],
-                'name': sg['name'],
-                'vpc': sg['vpc'],
-                'rules_count': len(sg.get('rules', [])),
-                'created_at': sg['created_at']
-            })
+        sg_summary = [{
+            'id': sg['id'],
+            'name': sg['name'],
+            'vpc': sg['vpc'],
+            'rules_count': len(sg.get('rules', ())),
+            'created_at': sg['created_at']
+        } for sg in security_groups]
         
         return {
             'security_groups': sg_summary,
@@ -215,70 +718,114 @@ class VPCManager:
     async def get_security_group(self, security_group_id: str, region: str) -> Dict[str, Any]:
         """Get detailed information about a specific security group including rules"""
         service = self._get_vpc_client(region)
-        response = service.get_security_group(id=security_group_id).get_result()
+        response = await _call_api(service.get_security_group, id=security_group_id)
         response['region'] = region
         return response
     
     async def list_security_group_rules(self, security_group_id: str, region: str) -> Dict[str, Any]:
         """List all rules for a specific security group"""
         service = self._get_vpc_client(region)
-        response = service.list_security_group_rules(security_group_id=security_group_id).get_result()
+        # Always a live read; the fresh rules also refresh the analyzers' per-group cache
+        rules, = await self._collect_security_group_rules(
+            service, region, [{'id': security_group_id}], refresh=True
+        )
+        if isinstance(rules, ApiException):
+            raise rules
         
         return {
             'security_group_id': security_group_id,
-            'rules': response['rules'],
-            'count': len(response['rules']),
+            'rules': rules,
+            'count': len(rules),
             'region': region
         }
     
+    async def _fetch_security_group_rules(self, service: ibm_vpc.VpcV1,
+                                          security_groups: List[Dict[str, Any]]) -> List[Any]:
+        """Fetch rules for each security group concurrently, returning rule lists or ApiExceptions in input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _fetch(sg_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    response = await asyncio.wait_for(
+                        _call_api(service.list_security_group_rules, security_group_id=sg_id),
+                        self.FAN_OUT_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    # Report a stalled group like any other per-group API failure
+                    raise ApiException(504, message=f'Timed out fetching rules after {self.FAN_OUT_TIMEOUT}s')
+            return response['rules']
+        
+        results = await asyncio.gather(*[_fetch(sg['id']) for sg in security_groups], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ApiException):
+                raise result
+        return results
+    
+    async def _collect_security_group_rules(self, service: ibm_vpc.VpcV1, region: str,
+                                            security_groups: List[Dict[str, Any]],
+                                            refresh: bool = False) -> List[Any]:
+        """Return each group's rules in input order, preferring rules embedded in the list response
+
+        Groups without embedded rules are served from a short-lived cache or fetched individually;
+        refresh=True skips the cache and refetches.
+        """
+        rule_sets = [sg.get('rules') for sg in security_groups]
+        now = time.monotonic()
+        
+        missing = []
+        for index, sg in enumerate(security_groups):
+            if rule_sets[index] is not None:
+                continue
+            key = (region, sg['id'])
+            cached = None if refresh else self._sg_rules_cache.get(key)
+            if cached and cached[0] > now:
+                self._sg_rules_cache.move_to_end(key)
+                rule_sets[index] = cached[1]
+            else:
+                missing.append(index)
+        
+        if missing:
+            await self._prime_token()
+            fetched = await self._fetch_security_group_rules(service, [security_groups[i] for i in missing])
+            expiry = time.monotonic() + self.SG_RULES_TTL
+            for index, rules in zip(missing, fetched):
+                rule_sets[index] = rules
+                if not isinstance(rules, ApiException):
+                    key = (region, security_groups[index]['id'])
+                    self._sg_rules_cache[key] = (expiry, rules)
+                    self._sg_rules_cache.move_to_end(key)
+            while len(self._sg_rules_cache) > self.SG_RULES_CACHE_MAXSIZE:
+                self._sg_rules_cache.popitem(last=False)
+        
+        return rule_sets
+    
     async def analyze_ssh_security_groups(self, region: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """Find security groups with SSH access open to 0.0.0.0/0"""
         service = self._get_vpc_client(region)
         
-        # Get all security groups
-        sg_response = service.list_security_groups().get_result()
-        security_groups = sg_response['security_groups']
-        
-        # Filter by VPC if specified
-        if vpc_id:
-            security_groups = [sg for sg in security_groups if sg['vpc']['id'] == vpc_id]
+        # Get security groups, filtered by VPC if specified
+        security_groups = await self._raw_security_groups(region, vpc_id)
         
         risky_groups = []
         
-        for sg in security_groups:
-            try:
-                # Get rules for this security group
-                rules_response = service.list_security_group_rules(security_group_id=sg['id']).get_result()
-                rules = rules_response['rules']
-                
-                risky_rules = []
-                for rule in rules:
-                    # Check for SSH access from anywhere
-                    if (rule.get('protocol') == 'tcp' and 
-                        rule.get('direction') == 'inbound'):
-                        
-                        # Check if port 22 is included in the rule
-                        port_min = rule.get('port_min', 0)
-                        port_max = rule.get('port_max', 65535)
-                        
-                        if port_min <= 22 <= port_max:
-                            # Check if source is 0.0.0.0/0
-                            remote = rule.get('remote', {})
-                            if (isinstance(remote, dict) and 
-                                remote.get('cidr_block') == '0.0.0.0/0'):
-                                risky_rules.append(rule)
-                
-                if risky_rules:
-                    risky_groups.append({
-                        'security_group_id': sg['id'],
-                        'security_group_name': sg['name'],
-                        'vpc': sg['vpc'],
-                        'risky_rules': risky_rules,
-                        'rule_count': len(risky_rules)
-                    })
-                    
-            except ApiException as e:
-                logger.warning(f"Error analyzing security group {sg['id']}: {e}")
+        rule_sets = await self._collect_security_group_rules(service, region, security_groups)
+        
+        for sg, rules in zip(security_groups, rule_sets):
+            if isinstance(rules, ApiException):
+                logger.warning(f"Error analyzing security group {sg['id']}: {rules}")
+                continue
+            
+            risky_rules = list(filter(_is_ssh_from_anywhere, rules))
+            
+            if risky_rules:
+                risky_groups.append({
+                    'security_group_id': sg['id'],
+                    'security_group_name': sg['name'],
+                    'vpc': sg['vpc'],
+                    'risky_rules': risky_rules,
+                    'rule_count': len(risky_rules)
+                })
         
         return {
             'risky_security_groups': risky_groups,
@@ -288,6 +835,37 @@ class VPCManager:
             'analysis_type': 'SSH access from 0.0.0.0/0'
         }
     
+    async def analyze_ssh_security_groups_all_regions(self) -> Dict[str, Any]:
+        """Find security groups with SSH access open to 0.0.0.0/0 across every region at once"""
+        regions_to_check = await self._regions_to_check()
+        await self._prime_token()
+        
+        results = await asyncio.gather(
+            *[self.analyze_ssh_security_groups(region_name) for region_name in regions_to_check],
+            return_exceptions=True
+        )
+        
+        risky_groups = []
+        region_errors = {}
+        for region_name, result in zip(regions_to_check, results):
+            if isinstance(result, ApiException):
+                logger.warning(f"Error analyzing security groups in region {region_name}: {result}")
+                region_errors[region_name] = str(result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for group in result['risky_security_groups']:
+                group['region'] = region_name
+            risky_groups.extend(result['risky_security_groups'])
+        
+        return {
+            'risky_security_groups': risky_groups,
+            'count': len(risky_groups),
+            'regions_checked': regions_to_check,
+            'region_errors': region_errors,
+            'analysis_type': 'SSH access from 0.0.0.0/0'
+        }
+    
     async def analyze_security_groups_by_protocol(self, region: str, protocol: str, 
                                                  port: Optional[int] = None, 
                                                  source_cidr: str = '0.0.0.0/0',
@@ -295,53 +873,29 @@ class VPCManager:
         """Analyze security groups for specific protocol/port combinations from a source CIDR"""
         service = self._get_vpc_client(region)
         
-        # Get all security groups
-        sg_response = service.list_security_groups().get_result()
-        security_groups = sg_response['security_groups']
-        
-        # Filter by VPC if specified
-        if vpc_id:
-            security_groups = [sg for sg in security_groups if sg['vpc']['id'] == vpc_id]
+        # Get security groups, filtered by VPC if specified
+        security_groups = await self._raw_security_groups(region, vpc_id)
         
         matching_groups = []
+        matches = _make_rule_predicate(protocol, port, source_cidr)
         
-        for sg in security_groups:
-            try:
-                # Get rules for this security group
-                rules_response = service.list_security_group_rules(security_group_id=sg['id']).get_result()
-                rules = rules_response['rules']
-                
-                matching_rules = []
-                for rule in rules:
-                    # Check protocol and direction
-                    if (rule.get('protocol') == protocol and 
-                        rule.get('direction') == 'inbound'):
-                        
-                        # Check port if specified
-                        if port is not None:
-                            port_min = rule.get('port_min', 0)
-                            port_max = rule.get('port_max', 65535)
-                            
-                            if not (port_min <= port <= port_max):
-                                continue
-                        
-                        # Check source CIDR
-                        remote = rule.get('remote', {})
-                        if (isinstance(remote, dict) and 
-                            remote.get('cidr_block') == source_cidr):
-                            matching_rules.append(rule)
-                
-                if matching_rules:
-                    matching_groups.append({
-                        'security_group_id': sg['id'],
-                        'security_group_name': sg['name'],
-                        'vpc': sg['vpc'],
-                        'matching_rules': matching_rules,
-                        'rule_count': len(matching_rules)
-                    })
-                    
-            except ApiException as e:
-                logger.warning(f"Error analyzing security group {sg['id']}: {e}")
+        rule_sets = await self._collect_security_group_rules(service, region, security_groups)
+        
+        for sg, rules in zip(security_groups, rule_sets):
+            if isinstance(rules, ApiException):
+                logger.warning(f"Error analyzing security group {sg['id']}: {rules}")
+                continue
+            
+            matching_rules = list(filter(matches, rules))
+            
+            if matching_rules:
+                matching_groups.append({
+                    'security_group_id': sg['id'],
+                    'security_group_name': sg['name'],
+                    'vpc': sg['vpc'],
+                    'matching_rules': matching_rules,
+                    'rule_count': len(matching_rules)
+                })
         
         analysis_desc = f"{protocol.upper()}"
         if port:
@@ -372,6 +926,7 @@ class VPCManager:
             'region': region
         }
     
+    @single_flight
     async def list_routing_tables(self, region: str, vpc_id: str,
                                  start: Optional[str] = None,
                                  limit: Optional[int] = None,
@@ -402,36 +957,7 @@ class VPCManager:
             logger.debug(f"Found {len(response_tables)} routing tables")
             
             for table in response_tables:
-                table_info = {
-                    'id': table.get('id', 'unknown'),
-                    'name': table.get('name', 'unknown'),
-                    'vpc': table.get('vpc', {}),
-                    'is_default': table.get('is_default', False),
-                    'lifecycle_state': table.get('lifecycle_state', 'unknown'),
-                    'resource_group': table.get('resource_group', {}),
-                    'created_at': table.get('created_at', 'unknown'),
-                    'href': table.get('href', 'unknown'),
-                    'route_direct_link_ingress': table.get('route_direct_link_ingress', False),
-                    'route_transit_gateway_ingress': table.get('route_transit_gateway_ingress', False),
-                    'route_vpc_zone_ingress': table.get('route_vpc_zone_ingress', False)
-                }
-                
-                # Add subnets if present
-                if 'subnets' in table and table['subnets']:
-                    subnets = []
-                    for subnet in table['subnets']:
-                        subnets.append({
-                            'id': subnet.get('id', 'unknown'),
-                            'name': subnet.get('name', 'unknown'),
-                            'href': subnet.get('href', 'unknown')
-                        })
-                    table_info['subnets'] = subnets
-                
-                # Add routes count if present
-                if 'routes' in table:
-                    table_info['routes_count'] = len(table['routes'])
-                
-                routing_tables.append(table_info)
+                routing_tables.append(_summarize_routing_table(table))
             
             # Apply name filter if specified (since API doesn't support it)
             if name:
@@ -458,6 +984,44 @@ class VPCManager:
                 'count': 0
             }
     
+    async def list_all_routing_tables(self, region: str, vpc_id: str,
+                                      is_default: Optional[bool] = None,
+                                      name: Optional[str] = None) -> Dict[str, Any]:
+        """List every routing table in a VPC, following pagination cursors"""
+        service = self._get_vpc_client(region)
+        
+        try:
+            params = {'vpc_id': vpc_id}
+            if is_default is not None:
+                params['is_default'] = is_default
+            
+            response_tables = await _fetch_all_pages(service.list_vpc_routing_tables, 'routing_tables', **params)
+            routing_tables = [_summarize_routing_table(table) for table in response_tables]
+            
+            # Apply name filter if specified (since API doesn't support it)
+            if name:
+                routing_tables = [rt for rt in routing_tables if name.lower() in rt['name'].lower()]
+            
+            return {
+                'routing_tables': routing_tables,
+                'count': len(routing_tables),
+                'region': region,
+                'filters': {
+                    'vpc_id': vpc_id,
+                    'is_default': is_default,
+                    'name': name
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"Error listing routing tables in region {region}: {str(e)}")
+            return {
+                'error': str(e),
+                'region': region,
+                'routing_tables': [],
+                'count': 0
+            }
+    
     async def get_routing_table(self, vpc_id: str, routing_table_id: str, region: str) -> Dict[str, Any]:
         """Get detailed information about a specific routing table"""
         service = self._get_vpc_client(region)
@@ -467,45 +1031,17 @@ class VPCManager:
             response = service.get_vpc_routing_table(vpc_id=vpc_id, id=routing_table_id).get_result()
             
             # Extract and enhance routing table information
-            table_info = {
-                'id': response.get('id', 'unknown'),
-                'name': response.get('name', 'unknown'),
-                'vpc': response.get('vpc', {}),
-                'is_default': response.get('is_default', False),
-                'lifecycle_state': response.get('lifecycle_state', 'unknown'),
-                'resource_group': response.get('resource_group', {}),
-                'created_at': response.get('created_at', 'unknown'),
-                'href': response.get('href', 'unknown'),
-                'route_direct_link_ingress': response.get('route_direct_link_ingress', False),
-                'route_transit_gateway_ingress': response.get('route_transit_gateway_ingress', False),
-                'route_vpc_zone_ingress': response.get('route_vpc_zone_ingress', False)
-            }
+            table_info = _project(response, _RT_FIELDS)
             
             # Add subnets if present
-            if 'subnets' in response and response['subnets']:
-                subnets = []
-                for subnet in response['subnets']:
-                    subnets.append({
-                        'id': subnet.get('id', 'unknown'),
-                        'name': subnet.get('name', 'unknown'),
-                        'href': subnet.get('href', 'unknown')
-                    })
-                table_info['subnets'] = subnets
+            if response.get('subnets'):
+                table_info['subnets'] = [_project(subnet, _RT_SUBNET_FIELDS) for subnet in response['subnets']]
             
             # Add routes if present
-            if 'routes' in response and response['routes']:
+            if response.get('routes'):
                 routes = []
                 for route in response['routes']:
-                    route_info = {
-                        'id': route.get('id', 'unknown'),
-                        'name': route.get('name', 'unknown'),
-                        'destination': route.get('destination', 'unknown'),
-                        'action': route.get('action', 'unknown'),
-                        'zone': route.get('zone', {}),
-                        'created_at': route.get('created_at', 'unknown'),
-                        'href': route.get('href', 'unknown'),
-                        'lifecycle_state': route.get('lifecycle_state', 'unknown')
-                    }
+                    route_info = _project(route, _RT_ROUTE_FIELDS)
                     
                     # Add next hop information
                     if 'next_hop' in route:
@@ -599,6 +1135,7 @@ class VPCManager:
             }
     
     # Backup Policy Methods
+    @single_flight
     async def list_backup_policies(self, region: str, 
                                  resource_group_id: Optional[str] = None,
                                  name: Optional[str] = None,
@@ -609,13 +1146,14 @@ class VPCManager:
         service = self._get_vpc_client(region)
         
         try:
-            response = service.list_backup_policies(
+            response = await _call_api(
+                service.list_backup_policies,
                 start=start,
                 limit=limit,
                 resource_group_id=resource_group_id,
                 name=name,
                 tag=tag
-            ).get_result()
+            )
             
             policies = response.get('backup_policies', [])
             
@@ -637,6 +1175,15 @@ class VPCManager:
             logger.error(f"Error listing backup policies in region {region}: {e}")
             raise
     
+    @ttl_cache(60)
+    async def get_backup_policy(self, backup_policy_id: str, region: str) -> Dict[str, Any]:
+        """Get details of a specific backup policy"""
+        service = self._get_vpc_client(region)
+        policy = await _call_api(service.get_backup_policy, id=backup_policy_id)
+        policy['region'] = region
+        return policy
+    
+    @single_flight
     async def list_backup_policy_jobs(self, backup_policy_id: str, region: str,
                                     status: Optional[str] = None,
                                     backup_policy_plan_id: Optional[str] = None,
@@ -645,24 +1192,29 @@ class VPCManager:
                                     sort: Optional[str] = None,
                                     source_id: Optional[str] = None,
                                     target_snapshots_id: Optional[str] = None,
-                                    target_snapshots_crn: Optional[str] = None) -> Dict[str, Any]:
-        """List jobs for a specific backup policy"""
+                                    target_snapshots_crn: Optional[str] = None,
+                                    all_pages: bool = False) -> Dict[str, Any]:
+        """List jobs for a specific backup policy, optionally following pagination to the last page"""
         service = self._get_vpc_client(region)
         
         try:
-            response = service.list_backup_policy_jobs(
-                backup_policy_id=backup_policy_id,
-                status=status,
-                backup_policy_plan_id=backup_policy_plan_id,
-                start=start,
-                limit=limit,
-                sort=sort,
-                source_id=source_id,
-                target_snapshots_id=target_snapshots_id,
-                target_snapshots_crn=target_snapshots_crn
-            ).get_result()
+            params = {
+                'backup_policy_id': backup_policy_id,
+                'status': status,
+                'backup_policy_plan_id': backup_policy_plan_id,
+                'start': start,
+                'limit': limit,
+                'sort': sort,
+                'source_id': source_id,
+                'target_snapshots_id': target_snapshots_id,
+                'target_snapshots_crn': target_snapshots_crn
+            }
             
-            jobs = response.get('jobs', [])
+            if all_pages:
+                jobs = await _fetch_all_pages(service.list_backup_policy_jobs, 'jobs', **params)
+            else:
+                response = await _call_api(service.list_backup_policy_jobs, **params)
+                jobs = response.get('jobs', [])
             
             # Add metadata to each job
             for job in jobs:
@@ -670,10 +1222,7 @@ class VPCManager:
                 job['backup_policy_id'] = backup_policy_id
             
             # Summarize job statuses
-            status_summary = {}
-            for job in jobs:
-                job_status = job.get('status', 'unknown')
-                status_summary[job_status] = status_summary.get(job_status, 0) + 1
+            status_summary = dict(Counter(job.get('status', 'unknown') for job in jobs))
             
             return {
                 'jobs': jobs,
@@ -697,10 +1246,11 @@ class VPCManager:
         service = self._get_vpc_client(region)
         
         try:
-            response = service.list_backup_policy_plans(
+            response = await _call_api(
+                service.list_backup_policy_plans,
                 backup_policy_id=backup_policy_id,
                 name=name
-            ).get_result()
+            )
             
             plans = response.get('plans', [])
             
@@ -724,45 +1274,67 @@ class VPCManager:
     
     async def get_backup_policy_summary(self, backup_policy_id: str, region: str) -> Dict[str, Any]:
         """Get comprehensive information about a backup policy including plans and recent jobs"""
-        summary = {
-            'backup_policy_id': backup_policy_id,
-            'region': region,
-            'timestamp': datetime.now().isoformat()
-        }
+        now = datetime.now(timezone.utc)
+        # The three lookups are independent, so overlap their round-trips
+        await self._prime_token()
+        results = await asyncio.gather(
+            self.get_backup_policy(backup_policy_id, region),
+            self.list_backup_policy_plans(backup_policy_id, region),
+            # Get recent jobs (last 50)
+            self.list_backup_policy_jobs(backup_policy_id, region, limit=50, sort='-created_at'),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
         
-        try:
-            # Get policy details (this would require get_backup_policy method)
-            service = self._get_vpc_client(region)
-            policy_response = service.get_backup_policy(id=backup_policy_id).get_result()
-            summary['policy_details'] = policy_response
-            summary['policy_details']['region'] = region
-        except Exception as e:
-            summary['policy_details'] = {'error': str(e)}
+        return _compose_backup_policy_summary(backup_policy_id, region, now, *results)
+    
+    async def bulk_backup_report(self, region: str,
+                                 resource_group_id: Optional[str] = None) -> Dict[str, Any]:
+        """Summarize and health-check every backup policy in a region
+
+        Policy details come from the single policy listing, so each policy costs one plans and one jobs
+        request, bounded by backup_job_concurrency. The same jobs feed both the summary and the health check.
+        """
+        policies_data = await self.list_backup_policies(region, resource_group_id=resource_group_id)
+        now = datetime.now(timezone.utc)
+        semaphore = asyncio.Semaphore(self.backup_job_concurrency)
         
-        try:
-            # Get plans
-            plans_data = await self.list_backup_policy_plans(backup_policy_id, region)
-            summary['plans'] = {
-                'count': plans_data['count'],
-                'plans': plans_data['plans']
-            }
-        except Exception as e:
-            summary['plans'] = {'error': str(e)}
+        async def _limited(method, *args, **kwargs) -> Dict[str, Any]:
+            async with semaphore:
+                return await method(*args, **kwargs)
         
-        try:
-            # Get recent jobs (last 50)
-            jobs_data = await self.list_backup_policy_jobs(
-                backup_policy_id, region, limit=50, sort='-created_at'
+        async def _report(policy: Dict[str, Any]) -> Dict[str, Any]:
+            plans_data, jobs_data = await asyncio.gather(
+                _limited(self.list_backup_policy_plans, policy['id'], region),
+                _limited(self.list_backup_policy_jobs, policy['id'], region, limit=50, sort='-created_at'),
+                return_exceptions=True
             )
-            summary['recent_jobs'] = {
-                'count': jobs_data['count'],
-                'status_summary': jobs_data['status_summary'],
-                'jobs': jobs_data['jobs'][:10]  # Only include last 10 jobs in summary
+            for result in (plans_data, jobs_data):
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
+            
+            if isinstance(jobs_data, Exception):
+                health = {'error': str(jobs_data)}
+            else:
+                health = analyze_backup_policy_health(policy, jobs_data['jobs'], now=now)
+            return {
+                'summary': _compose_backup_policy_summary(policy['id'], region, now, policy, plans_data, jobs_data),
+                'health': health
             }
-        except Exception as e:
-            summary['recent_jobs'] = {'error': str(e)}
         
-        return summary
+        reports = await asyncio.gather(*[_report(policy) for policy in policies_data['backup_policies']])
+        
+        return {
+            'region': region,
+            'timestamp': now.isoformat(),
+            'reports': reports,
+            'count': len(reports),
+            'filters': {
+                'resource_group_id': resource_group_id
+            }
+        }
     
     async def analyze_backup_policies(self, region: str, 
                                     resource_group_id: Optional[str] = None) -> Dict[str, Any]:
@@ -776,7 +1348,7 @@ class VPCManager:
             
             analysis = {
                 'region': region,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
                 'total_policies': len(policies),
                 'policy_health': [],
                 'summary': {
@@ -787,46 +1359,58 @@ class VPCManager:
                 }
             }
             
-            for policy in policies:
+            counts = analysis['summary']
+            semaphore = asyncio.Semaphore(self.backup_job_concurrency)
+            
+            async def _jobs_for(policy_id: str) -> Dict[str, Any]:
+                # One bounded page of the newest jobs gives both the latest status and the recent failures
+                async with semaphore:
+                    return await self.list_backup_policy_jobs(
+                        policy_id, region, limit=10, sort='-created_at'
+                    )
+            
+            # Fetch every policy's recent jobs up front instead of one round-trip per loop iteration
+            jobs_results = await asyncio.gather(*[_jobs_for(p['id']) for p in policies], return_exceptions=True)
+            
+            for policy, jobs_data in zip(policies, jobs_results):
                 policy_id = policy['id']
                 policy_name = policy.get('name', 'Unnamed')
                 
+                issues = []
                 policy_health = {
                     'policy_id': policy_id,
                     'policy_name': policy_name,
                     'status': policy.get('lifecycle_state', 'unknown'),
-                    'issues': []
+                    'issues': issues
                 }
                 
                 # Check if policy is active
                 if policy.get('lifecycle_state') == 'stable':
-                    analysis['summary']['active_policies'] += 1
+                    counts['active_policies'] += 1
                 else:
-                    analysis['summary']['inactive_policies'] += 1
-                    policy_health['issues'].append('Policy is not in stable state')
+                    counts['inactive_policies'] += 1
+                    issues.append('Policy is not in stable state')
                 
-                try:
+                if isinstance(jobs_data, Exception):
+                    issues.append(f'Error retrieving jobs: {str(jobs_data)}')
+                elif isinstance(jobs_data, BaseException):
+                    raise jobs_data
+                else:
                     # Check recent jobs
-                    jobs_data = await self.list_backup_policy_jobs(
-                        policy_id, region, limit=10, sort='-created_at'
-                    )
-                    
                     recent_jobs = jobs_data['jobs']
                     if not recent_jobs:
-                        analysis['summary']['policies_without_recent_jobs'] += 1
-                        policy_health['issues'].append('No recent backup jobs found')
+                        counts['policies_without_recent_jobs'] += 1
+                        issues.append('No recent backup jobs found')
                     else:
-                        # Check for failed jobs
-                        failed_jobs = [j for j in recent_jobs if j.get('status') == 'failed']
-                        if failed_jobs:
-                            analysis['summary']['policies_with_failed_jobs'] += 1
-                            policy_health['issues'].append(f'{len(failed_jobs)} recent failed jobs')
+                        # Check for failed jobs among the recent ones only
+                        failed_count = sum(1 for job in recent_jobs if job.get('status') == 'failed')
+                        if failed_count:
+                            counts['policies_with_failed_jobs'] += 1
+                            issues.append(f'{failed_count} recent failed jobs')
                         
-                        policy_health['last_job_status'] = recent_jobs[0].get('status')
-                        policy_health['last_job_date'] = recent_jobs[0].get('created_at')
-                
-                except Exception as e:
-                    policy_health['issues'].append(f'Error retrieving jobs: {str(e)}')
+                        latest_job = recent_jobs[0]
+                        policy_health['last_job_status'] = latest_job.get('status')
+                        policy_health['last_job_date'] = latest_job.get('created_at')
                 
                 analysis['policy_health'].append(policy_health)
             
@@ -836,84 +1420,122 @@ class VPCManager:
             logger.error(f"Error analyzing backup policies in region {region}: {e}")
             raise
     
+    async def stream_vpc_resources_summary(self, vpc_id: str, region: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (section, payload) for each part of a VPC resources summary as soon as it completes
+
+        Sections are 'vpc_details', 'subnets', 'instances', 'security_groups', 'public_gateways' and
+        'security_analysis'. A section that fails yields {'error': ...} instead of stopping the stream.
+        """
+        async def _vpc_details() -> Dict[str, Any]:
+            try:
+                vpc = await self.get_vpc(vpc_id, region)
+                return {
+                    'name': vpc['name'],
+                    'status': vpc['status'],
+                    'created_at': vpc['created_at']
+                }
+            except Exception as e:
+                return {'error': str(e)}
+        
+        async def _subnets() -> Dict[str, Any]:
+            try:
+                subnets_data = await self.list_subnets(region, vpc_id)
+                return {
+                    'count': subnets_data['count'],
+                    'zones': sorted({s['zone']['name'] for s in subnets_data['subnets']})
+                }
+            except Exception as e:
+                return {'error': str(e)}
+        
+        async def _instances() -> Dict[str, Any]:
+            try:
+                instances_data = await self.list_instances(region, vpc_id)
+                return {
+                    'count': instances_data['count'],
+                    'by_status': dict(Counter(instance['status'] for instance in instances_data['instances']))
+                }
+            except Exception as e:
+                return {'error': str(e)}
+        
+        async def _security_groups() -> Dict[str, Any]:
+            try:
+                # Only the count is needed; the raw listing is shared with the SSH analysis below
+                return {'count': len(await self._raw_security_groups(region, vpc_id))}
+            except Exception as e:
+                return {'error': str(e)}
+        
+        async def _public_gateways() -> Dict[str, Any]:
+            try:
+                pg_data = await self.list_public_gateways(region, vpc_id)
+                return {'count': pg_data['count']}
+            except Exception as e:
+                return {'error': str(e)}
+        
+        async def _ssh_analysis() -> Dict[str, Any]:
+            try:
+                ssh_analysis = await self.analyze_ssh_security_groups(region, vpc_id)
+                return {
+                    'ssh_open_to_internet': {
+                        'risky_groups_count': ssh_analysis['count'],
+                        'risky_groups': [
+                            {
+                                'name': group['security_group_name'],
+                                'id': group['security_group_id']
+                            } for group in ssh_analysis['risky_security_groups']
+                        ]
+                    }
+                }
+            except Exception as e:
+                return {'error': str(e)}
+        
+        sections = {
+            'vpc_details': _vpc_details,
+            'subnets': _subnets,
+            'instances': _instances,
+            'security_groups': _security_groups,
+            'public_gateways': _public_gateways,
+            'security_analysis': _ssh_analysis
+        }
+        
+        async def _named(section: str, fetch) -> Tuple[str, Dict[str, Any]]:
+            try:
+                return section, await asyncio.wait_for(fetch(), self.FAN_OUT_TIMEOUT)
+            except asyncio.TimeoutError:
+                return section, {'error': f'Timed out after {self.FAN_OUT_TIMEOUT}s'}
+        
+        # Every section is an independent lookup, so fetch them all at once
+        await self._prime_token()
+        tasks = [asyncio.ensure_future(_named(section, fetch)) for section, fetch in sections.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding sections if the consumer bails out early
+            for task in tasks:
+                task.cancel()
+    
+    async def vpc_resources_summary_sections(self, vpc_id: str, region: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Fetch every summary section concurrently and return (section, payload) pairs in the fixed summary order"""
+        results = {}
+        async for section, payload in self.stream_vpc_resources_summary(vpc_id, region):
+            results[section] = payload
+        return [(section, results[section]) for section in self._SUMMARY_SECTIONS]
+    
     async def get_vpc_resources_summary(self, vpc_id: str, region: str) -> Dict[str, Any]:
         """Get a comprehensive summary of all resources in a VPC"""
         summary = {
             'vpc_id': vpc_id,
             'region': region,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'resources': {}
         }
         
-        # Get VPC details
-        try:
-            vpc = await self.get_vpc(vpc_id, region)
-            summary['vpc_details'] = {
-                'name': vpc['name'],
-                'status': vpc['status'],
-                'created_at': vpc['created_at']
-            }
-        except Exception as e:
-            summary['vpc_details'] = {'error': str(e)}
-        
-        # Count subnets
-        try:
-            subnets_data = await self.list_subnets(region, vpc_id)
-            summary['resources']['subnets'] = {
-                'count': subnets_data['count'],
-                'zones': list(set(s['zone']['name'] for s in subnets_data['subnets']))
-            }
-        except Exception as e:
-            summary['resources']['subnets'] = {'error': str(e)}
-        
-        # Count instances
-        try:
-            instances_data = await self.list_instances(region, vpc_id)
-            summary['resources']['instances'] = {
-                'count': instances_data['count'],
-                'by_status': {}
-            }
-            for instance in instances_data['instances']:
-                status = instance['status']
-                summary['resources']['instances']['by_status'][status] = \
-                    summary['resources']['instances']['by_status'].get(status, 0) + 1
-        except Exception as e:
-            summary['resources']['instances'] = {'error': str(e)}
-        
-        # Count security groups
-        try:
-            sg_data = await self.list_security_groups(region, vpc_id)
-            summary['resources']['security_groups'] = {
-                'count': sg_data['count']
-            }
-        except Exception as e:
-            summary['resources']['security_groups'] = {'error': str(e)}
-        
-        # Count public gateways
-        try:
-            pg_data = await self.list_public_gateways(region, vpc_id)
-            summary['resources']['public_gateways'] = {
-                'count': pg_data['count']
-            }
-        except Exception as e:
-            summary['resources']['public_gateways'] = {'error': str(e)}
+        results = dict(await self.vpc_resources_summary_sections(vpc_id, region))
         
-        # Analyze SSH security
-        try:
-            ssh_analysis = await self.analyze_ssh_security_groups(region, vpc_id)
-            summary['security_analysis'] = {
-                'ssh_open_to_internet': {
-                    'risky_groups_count': ssh_analysis['count'],
-                    'risky_groups': [
-                        {
-                            'name': group['security_group_name'],
-                            'id': group['security_group_id']
-                        } for group in ssh_analysis['risky_security_groups']
-                    ]
-                }
-            }
-        except Exception as e:
-            summary['security_analysis'] = {'error': str(e)}
+        summary['vpc_details'] = results['vpc_details']
+        for section in self._RESOURCE_SECTIONS:
+            summary['resources'][section] = results[section]
+        summary['security_analysis'] = results['security_analysis']
         
         return summary
 
@@ -1065,26 +1687,7 @@ class VPCManager:
             response = service.get_vpn_server_client_configuration(vpn_server_id).get_result()
             
             # The API returns a string containing the client configuration file content
-            # Handle potential encoding issues with the configuration string
-            if isinstance(response, bytes):
-                try:
-                    config_content = response.decode('utf-8')
-                except UnicodeDecodeError:
-                    # If it's binary data that can't be decoded, base64 encode it
-                    import base64
-                    config_content = base64.b64encode(response).decode('ascii')
-                    encoding_used = "base64"
-                else:
-                    encoding_used = "utf-8"
-            else:
-                # Already a string - ensure it's properly encoded
-                try:
-                    config_content = str(response).encode('utf-8').decode('utf-8')
-                    encoding_used = "utf-8"
-                except UnicodeDecodeError:
-                    # If there are encoding issues, replace problematic characters
-                    config_content = str(response).encode('utf-8', errors='replace').decode('utf-8')
-                    encoding_used = "utf-8-replaced"
+            config_content, encoding_used = _decode_client_configuration(response)
             
             # Return structured response with metadata
             result = {
@@ -1164,19 +1767,66 @@ class VPCManager:
             raise
 
 
+_b64encode = base64.b64encode
+
+
+def _decode_client_configuration(response: Any) -> Tuple[str, str]:
+    """Return (content, encoding) for a VPN client configuration payload
+
+    ASCII bytes are decoded directly; other bytes fall back to base64 only when they are not valid UTF-8.
+    """
+    if isinstance(response, str):
+        if response.isascii():
+            return response, "utf-8"
+        try:
+            response.encode('utf-8')
+        except UnicodeEncodeError:
+            # If there are encoding issues, replace problematic characters
+            return response.encode('utf-8', errors='replace').decode('utf-8'), "utf-8-replaced"
+        return response, "utf-8"
+    
+    if isinstance(response, bytes):
+        if response.isascii():
+            return response.decode('ascii'), "utf-8"
+        try:
+            return response.decode('utf-8'), "utf-8"
+        except UnicodeDecodeError:
+            # If it's binary data that can't be decoded, base64 encode it
+            return _b64encode(response).decode('ascii'), "base64"
+    
+    return _decode_client_configuration(str(response))
+
+
 # Convenience functions for backward compatibility and ease of use
-async def create_vpc_manager(api_key: str) -> VPCManager:
+async def create_vpc_manager(api_key: str, cache_dir: Optional[str] = None) -> VPCManager:
     """Create a VPC manager instance with API key authentication"""
     authenticator = IAMAuthenticator(apikey=api_key)
-    return VPCManager(authenticator)
+    return VPCManager(authenticator, cache_dir=cache_dir)
+
+
+# Commonly attacked TCP ports; kept sorted so a rule's port range is matched with bisect
+_RISKY_PORT_NAMES = {
+    22: "SSH",
+    23: "Telnet",
+    3389: "RDP",
+    1433: "SQL Server",
+    3306: "MySQL",
+    5432: "PostgreSQL",
+    21: "FTP",
+    25: "SMTP"
+}
+_RISKY_PORTS_SORTED = sorted(_RISKY_PORT_NAMES)
+_HIGH_RISK_PORTS = frozenset({22, 23, 3389})
 
 
 def analyze_security_rule_risk(rule: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze a single security group rule for potential risks"""
     risk_factors = []
     risk_level = "low"
+    direction = rule.get('direction')
+    protocol = rule.get('protocol')
     
-    if rule.get('direction') == 'inbound':
+    if direction == 'inbound':
         # Check for overly permissive source
         remote = rule.get('remote', {})
         if isinstance(remote, dict) and remote.get('cidr_block') == '0.0.0.0/0':
@@ -1184,25 +1834,15 @@ def analyze_security_rule_risk(rule: Dict[str, Any]) -> Dict[str, Any]:
             risk_level = "high"
         
         # Check for commonly attacked ports
-        protocol = rule.get('protocol')
         port_min = rule.get('port_min', 0)
         port_max = rule.get('port_max', 65535)
         
-        risky_ports = {
-            22: "SSH",
-            23: "Telnet",
-            3389: "RDP",
-            1433: "SQL Server",
-            3306: "MySQL",
-            5432: "PostgreSQL",
-            21: "FTP",
-            25: "SMTP"
-        }
-        
-        for port, service in risky_ports.items():
-            if port_min <= port <= port_max and protocol == 'tcp':
-                risk_factors.append(f"Exposes {service} (port {port})")
-                if port in [22, 23, 3389] and risk_level != "high":
+        if protocol == 'tcp':
+            lo = bisect.bisect_left(_RISKY_PORTS_SORTED, port_min)
+            hi = bisect.bisect_right(_RISKY_PORTS_SORTED, port_max)
+            for port in _RISKY_PORTS_SORTED[lo:hi]:
+                risk_factors.append(f"Exposes {_RISKY_PORT_NAMES[port]} (port {port})")
+                if port in _HIGH_RISK_PORTS and risk_level != "high":
                     risk_level = "medium"
         
         # Check for wide port ranges
@@ -1211,18 +1851,64 @@ def analyze_security_rule_risk(rule: Dict[str, Any]) -> Dict[str, Any]:
             if risk_level == "low":
                 risk_level = "medium"
     
+    rule_port_min = rule.get('port_min')
     return {
         'rule_id': rule.get('id'),
         'risk_level': risk_level,
         'risk_factors': risk_factors,
-        'protocol': rule.get('protocol'),
-        'direction': rule.get('direction'),
-        'port_range': f"{rule.get('port_min', 'any')}-{rule.get('port_max', 'any')}" if rule.get('port_min') else "all"
+        'protocol': protocol,
+        'direction': direction,
+        'port_range': f"{rule_port_min}-{rule.get('port_max', 'any')}" if rule_port_min else "all"
     }
 
 
-def analyze_backup_policy_health(policy: Dict[str, Any], jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Analyze the health of a backup policy based on its configuration and recent jobs"""
+_MISSING = object()
+
+
+def analyze_security_rule_risks(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Analyze many security group rules, returning one result per rule in input order
+
+    Rules that differ only by id share one analysis, since the same direction/protocol/port/source
+    shapes repeat heavily across security groups.
+    """
+    by_shape = {}
+    results = []
+    for rule in rules:
+        remote = rule.get('remote', {})
+        shape = (
+            rule.get('direction'),
+            rule.get('protocol'),
+            rule.get('port_min', _MISSING),
+            rule.get('port_max', _MISSING),
+            isinstance(remote, dict) and remote.get('cidr_block') == '0.0.0.0/0'
+        )
+        analysis = by_shape.get(shape)
+        if analysis is None:
+            analysis = by_shape[shape] = analyze_security_rule_risk(rule)
+        results.append({**analysis, 'rule_id': rule.get('id'), 'risk_factors': list(analysis['risk_factors'])})
+    return results
+
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an API ISO 8601 timestamp; cached since the same job timestamps are re-read across analyses"""
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def analyze_backup_policy_health(policy: Dict[str, Any], jobs: List[Dict[str, Any]],
+                                 now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Analyze the health of a backup policy based on its configuration and recent jobs
+
+    Pass a shared aware `now` when analyzing many policies so they are judged against one instant.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
     health_score = 100
     issues = []
     recommendations = []
@@ -1241,21 +1927,22 @@ def analyze_backup_policy_health(policy: Dict[str, Any], jobs: List[Dict[str, An
     else:
         # Check recent job failures
         recent_jobs = jobs[:10]  # Last 10 jobs
-        failed_jobs = [j for j in recent_jobs if j.get('status') == 'failed']
+        recent_count = len(recent_jobs)
+        failed_count = sum(1 for j in recent_jobs if j.get('status') == 'failed')
         
-        if failed_jobs:
-            failure_rate = len(failed_jobs) / len(recent_jobs)
+        if failed_count:
+            failure_rate = failed_count / recent_count
             if failure_rate > 0.5:
                 health_score -= 30
-                issues.append(f"High failure rate: {len(failed_jobs)}/{len(recent_jobs)} recent jobs failed")
+                issues.append(f"High failure rate: {failed_count}/{recent_count} recent jobs failed")
                 recommendations.append("Investigate job failures and fix underlying issues")
             elif failure_rate > 0.2:
                 health_score -= 15
-                issues.append(f"Some recent failures: {len(failed_jobs)}/{len(recent_jobs)} recent jobs failed")
+                issues.append(f"Some recent failures: {failed_count}/{recent_count} recent jobs failed")
                 recommendations.append("Monitor job failures and address any issues")
         
         # Check job frequency
-        if len(recent_jobs) < 5:
+        if recent_count < 5:
             health_score -= 10
             issues.append("Few recent backup jobs")
             recommendations.append("Consider increasing backup frequency if appropriate")
@@ -1263,9 +1950,8 @@ def analyze_backup_policy_health(policy: Dict[str, Any], jobs: List[Dict[str, An
         # Check for very old last job
         if recent_jobs:
             try:
-                from datetime import datetime, timedelta
-                last_job_date = datetime.fromisoformat(recent_jobs[0]['created_at'].replace('Z', '+00:00'))
-                days_ago = (datetime.now().astimezone() - last_job_date).days
+                last_job_date = _parse_iso(recent_jobs[0]['created_at'])
+                days_ago = (now - last_job_date).days
                 
                 if days_ago > 7:
                     health_score -= 20
@@ -1290,5 +1976,5 @@ def analyze_backup_policy_health(policy: Dict[str, Any], jobs: List[Dict[str, An
         'status': status,
         'issues': issues,
         'recommendations': recommendations,
-        'analysis_timestamp': datetime.now().isoformat()
+        'analysis_timestamp': now.isoformat()
     }
\ No newline at end of file
@@ -6,7 +6,8 @@ Provides VPC resource management capabilities through MCP protocol
 import os
 import json
 import logging
-from typing import Dict, List, Any
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 import asyncio
 
 from mcp.server import Server
@@ -17,1186 +18,1366 @@ from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from utils import VPCManager
 from storage import StorageManager
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class VPCMCPServer:
-    def __init__(self):
-        self.server = Server("ibm-vpc-mcp")
-        self.vpc_manager = None
-        self._setup_handlers()
-        # Add this line to initialize the StorageManager
-        self.storage_manager = None
-        self._setup_handlers()
+def _dumps_result(result: Any, indent: bool = True) -> str:
+    """Serialize a tool result as JSON (indented unless indent=False), using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(result, option=option).decode('utf-8')
+    if indent:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(',', ':'))
 
-    def _setup_handlers(self):
-        """Set up MCP server handlers"""
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="list_regions",
-                    description="List all available IBM Cloud VPC regions",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="list_vpcs",
-                    description="List VPCs in account or specific region",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name (optional, defaults to all regions)"
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_vpc",
-                    description="Get details of a specific VPC",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "VPC ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region where VPC is located"
-                            }
-                        },
-                        "required": ["vpc_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="list_subnets",
-                    description="List subnets in a VPC or region",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="list_instances",
-                    description="List compute instances",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="list_instance_profiles",
-                    description="List available instance profiles",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="list_public_gateways",
-                    description="List public gateways",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="list_security_groups",
-                    description="List security groups",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="get_security_group",
-                    description="Get detailed information about a specific security group including rules",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "security_group_id": {
-                                "type": "string",
-                                "description": "Security group ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            }
-                        },
-                        "required": ["security_group_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="list_security_group_rules",
-                    description="List all rules for a specific security group",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "security_group_id": {
-                                "type": "string",
-                                "description": "Security group ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            }
-                        },
-                        "required": ["security_group_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="analyze_ssh_security_groups",
-                    description="Find security groups with SSH access open to 0.0.0.0/0",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="analyze_security_groups_by_protocol",
-                    description="Analyze security groups for specific protocol/port combinations from a source CIDR",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "protocol": {
-                                "type": "string",
-                                "description": "Protocol (tcp, udp, icmp)"
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Port number (optional)"
-                            },
-                            "source_cidr": {
-                                "type": "string",
-                                "description": "Source CIDR block (default: 0.0.0.0/0)",
-                                "default": "0.0.0.0/0"
-                            },
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "Filter by VPC ID (optional)"
-                            }
-                        },
-                        "required": ["region", "protocol"]
-                    }
-                ),
-                Tool(
-                    name="list_floating_ips",
-                    description="List all floating IPs in a region",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="get_vpc_resources_summary",
-                    description="Get a summary of all resources in a VPC including security analysis",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "vpc_id": {
-                                "type": "string",
-                                "description": "VPC ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region where VPC is located"
-                            }
-                        },
-                        "required": ["vpc_id", "region"]
-                    }
-                ),
-                # Backup Policy Tools
-                Tool(
-                    name="list_backup_policies",
-                    description="List backup policies in a region with optional filtering",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "resource_group_id": {
-                                "type": "string",
-                                "description": "Filter by resource group ID (optional)"
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Filter by policy name (optional)"
-                            },
-                            "tag": {
-                                "type": "string",
-                                "description": "Filter by tag (optional)"
-                            },
-                            "start": {
-                                "type": "string",
-                                "description": "Pagination start token (optional)"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-                Tool(
-                    name="list_backup_policy_jobs",
-                    description="List jobs for a specific backup policy",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "backup_policy_id": {
-                                "type": "string",
-                                "description": "Backup policy ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "status": {
-                                "type": "string",
-                                "description": "Filter by job status (optional)"
-                            },
-                            "backup_policy_plan_id": {
-                                "type": "string",
-                                "description": "Filter by plan ID (optional)"
-                            },
-                            "start": {
-                                "type": "string",
-                                "description": "Pagination start token (optional)"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (optional)"
-                            },
-                            "sort": {
-                                "type": "string",
-                                "description": "Sort order (optional, e.g., '-created_at')"
-                            },
-                            "source_id": {
-                                "type": "string",
-                                "description": "Filter by source ID (optional)"
-                            },
-                            "target_snapshots_id": {
-                                "type": "string",
-                                "description": "Filter by target snapshot ID (optional)"
-                            },
-                            "target_snapshots_crn": {
-                                "type": "string",
-                                "description": "Filter by target snapshot CRN (optional)"
-                            }
-                        },
-                        "required": ["backup_policy_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="list_backup_policy_plans",
-                    description="List plans for a specific backup policy",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "backup_policy_id": {
-                                "type": "string",
-                                "description": "Backup policy ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Filter by plan name (optional)"
-                            }
-                        },
-                        "required": ["backup_policy_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="get_backup_policy_summary",
-                    description="Get comprehensive information about a backup policy including plans and recent jobs",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "backup_policy_id": {
-                                "type": "string",
-                                "description": "Backup policy ID"
-                            },
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            }
-                        },
-                        "required": ["backup_policy_id", "region"]
-                    }
-                ),
-                Tool(
-                    name="analyze_backup_policies",
-                    description="Analyze backup policies in a region for health and compliance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "string",
-                                "description": "Region name"
-                            },
-                            "resource_group_id": {
-                                "type": "string",
-                                "description": "Filter by resource group ID (optional)"
-                            }
-                        },
-                        "required": ["region"]
-                    }
-                ),
-        Tool(
-            name="list_volumes",
-            description="List block storage volumes in a region with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    },
-                    "attachment_state": {
-                        "type": "string",
-                        "description": "Filter by attachment state (optional: attached, unattached)"
-                    },
-                    "encryption": {
-                        "type": "string",
-                        "description": "Filter by encryption type (optional)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by volume name (optional)"
-                    },
-                    "operating_system_family": {
-                        "type": "string",
-                        "description": "Filter by operating system family (optional)"
-                    },
-                    "operating_system_architecture": {
-                        "type": "string",
-                        "description": "Filter by operating system architecture (optional)"
-                    },
-                    "tag": {
-                        "type": "string",
-                        "description": "Filter by tag (optional)"
-                    },
-                    "zone_name": {
-                        "type": "string",
-                        "description": "Filter by zone name (optional)"
-                    }
-                },
-                "required": ["region"]
+
+async def _dumps_result_async(result: Any) -> str:
+    """Serialize a tool result without stalling the event loop on the slow stdlib path
+
+    orjson holds the GIL for its (short) run, so a thread would not help it; the stdlib encoder's
+    indented mode is pure Python and is worth moving to a worker thread.
+    """
+    if orjson is not None:
+        return _dumps_result(result)
+    return await asyncio.to_thread(_dumps_result, result)
+
+
+# Built once at import; list_tools hands back the same list on every request
+_TOOLS: List[Tool] = [
+    Tool(
+        name="list_regions",
+        description="List all available IBM Cloud VPC regions",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="list_vpcs",
+        description="List VPCs in account or specific region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name (optional, defaults to all regions)"
+                }
             }
-        ),
-        Tool(
-            name="list_volume_profiles",
-            description="List available volume profiles in a region",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    }
+        }
+    ),
+    Tool(
+        name="get_vpc",
+        description="Get details of a specific VPC",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpc_id": {
+                    "type": "string",
+                    "description": "VPC ID"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="get_volume",
-            description="Get detailed information about a specific volume",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "volume_id": {
-                        "type": "string",
-                        "description": "Volume ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "region": {
+                    "type": "string",
+                    "description": "Region where VPC is located"
+                }
+            },
+            "required": ["vpc_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_subnets",
+        description="List subnets in a VPC or region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["volume_id", "region"]
-            }
-        ),
-        Tool(
-            name="analyze_storage_usage",
-            description="Analyze block storage usage in a region",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_instances",
+        description="List compute instances",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="list_shares",
-            description="List file shares in a region with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    },
-                    "resource_group_id": {
-                        "type": "string",
-                        "description": "Filter by resource group ID (optional)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by share name (optional)"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort order (optional)"
-                    },
-                    "replication_role": {
-                        "type": "string",
-                        "description": "Filter by replication role (optional)"
-                    }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_instance_profiles",
+        description="List available instance profiles",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_public_gateways",
+        description="List public gateways",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="get_share",
-            description="Get detailed information about a specific file share",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "share_id": {
-                        "type": "string",
-                        "description": "Share ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_security_groups",
+        description="List security groups",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["share_id", "region"]
-            }
-        ),
-        Tool(
-            name="list_share_profiles",
-            description="List available file share profiles in a region",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort order (optional)"
-                    }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_security_group",
+        description="Get detailed information about a specific security group including rules",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "security_group_id": {
+                    "type": "string",
+                    "description": "Security group ID"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="list_routing_tables",
-            description="List routing tables in a VPC (vpc_id is required)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "vpc_id": {
-                        "type": "string",
-                        "description": "VPC ID (required)"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    },
-                    "is_default": {
-                        "type": "boolean",
-                        "description": "Filter by default routing table (optional)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by routing table name (optional)"
-                    }
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["security_group_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_security_group_rules",
+        description="List all rules for a specific security group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "security_group_id": {
+                    "type": "string",
+                    "description": "Security group ID"
                 },
-                "required": ["region", "vpc_id"]
-            }
-        ),
-        Tool(
-            name="get_routing_table",
-            description="Get detailed information about a specific routing table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpc_id": {
-                        "type": "string",
-                        "description": "VPC ID"
-                    },
-                    "routing_table_id": {
-                        "type": "string",
-                        "description": "Routing table ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["security_group_id", "region"]
+        }
+    ),
+    Tool(
+        name="analyze_ssh_security_groups",
+        description="Find security groups with SSH access open to 0.0.0.0/0",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["vpc_id", "routing_table_id", "region"]
-            }
-        ),
-        Tool(
-            name="find_routing_table_by_name",
-            description="Find a routing table by name and return its UUID and details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "vpc_id": {
-                        "type": "string",
-                        "description": "VPC ID"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Routing table name to search for"
-                    }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="analyze_ssh_security_groups_all_regions",
+        description="Find security groups with SSH access open to 0.0.0.0/0 in every region",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="analyze_security_groups_by_protocol",
+        description="Analyze security groups for specific protocol/port combinations from a source CIDR",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["region", "vpc_id", "name"]
-            }
-        ),
-        Tool(
-            name="list_snapshots",
-            description="List block storage snapshots in a region with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token (optional)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (optional)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by snapshot name (optional)"
-                    },
-                    "source_volume_id": {
-                        "type": "string",
-                        "description": "Filter by source volume ID (optional)"
-                    },
-                    "resource_group_id": {
-                        "type": "string",
-                        "description": "Filter by resource group ID (optional)"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort order (optional)"
-                    }
+                "protocol": {
+                    "type": "string",
+                    "description": "Protocol (tcp, udp, icmp)"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="get_snapshot",
-            description="Get detailed information about a specific snapshot",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "snapshot_id": {
-                        "type": "string",
-                        "description": "Snapshot ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "port": {
+                    "type": "integer",
+                    "description": "Port number (optional)"
                 },
-                "required": ["snapshot_id", "region"]
-            }
-        ),
-        Tool(
-            name="analyze_snapshot_usage",
-            description="Analyze snapshot usage in a region",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "source_cidr": {
+                    "type": "string",
+                    "description": "Source CIDR block (default: 0.0.0.0/0)",
+                    "default": "0.0.0.0/0"
                 },
-                "required": ["region"]
-            }
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Filter by VPC ID (optional)"
+                }
+            },
+            "required": ["region", "protocol"]
+        }
+    ),
+    Tool(
+        name="list_floating_ips",
+        description="List all floating IPs in a region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_vpc_resources_summary",
+        description=(
+            "Get a summary of all resources in a VPC including security analysis, as newline-delimited JSON: "
+            "a header line with vpc_id, region and timestamp, then one line per section "
+            "(vpc_details, subnets, instances, security_groups, public_gateways, security_analysis)"
         ),
-        Tool(
-            name="list_vpn_gateways",
-            description="List VPN gateways in a region with optional VPC filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "vpc_id": {
-                        "type": "string",
-                        "description": "Optional VPC ID to filter gateways"
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of gateways to return (default 50)"
-                    },
-                    "start": {
-                        "type": "string", 
-                        "description": "Pagination start token"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpc_id": {
+                    "type": "string",
+                    "description": "VPC ID"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="get_vpn_gateway",
-            description="Get detailed information about a specific VPN gateway",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpn_gateway_id": {
-                        "type": "string",
-                        "description": "VPN gateway ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "region": {
+                    "type": "string",
+                    "description": "Region where VPC is located"
+                }
+            },
+            "required": ["vpc_id", "region"]
+        }
+    ),
+    # Backup Policy Tools
+    Tool(
+        name="list_backup_policies",
+        description="List backup policies in a region with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["vpn_gateway_id", "region"]
-            }
-        ),
-        Tool(
-            name="list_vpn_servers",
-            description="List VPN servers in a region with optional name filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of servers to return (default 50)"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Optional name filter for servers"
-                    }
+                "resource_group_id": {
+                    "type": "string",
+                    "description": "Filter by resource group ID (optional)"
                 },
-                "required": ["region"]
-            }
-        ),
-        Tool(
-            name="get_vpn_server", 
-            description="Get detailed information about a specific VPN server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpn_server_id": {
-                        "type": "string",
-                        "description": "VPN server ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "name": {
+                    "type": "string",
+                    "description": "Filter by policy name (optional)"
                 },
-                "required": ["vpn_server_id", "region"]
-            }
-        ),
-        Tool(
-            name="get_ike_policy",
-            description="Get detailed information about a specific IKE policy",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ike_policy_id": {
-                        "type": "string",
-                        "description": "IKE policy ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "tag": {
+                    "type": "string",
+                    "description": "Filter by tag (optional)"
                 },
-                "required": ["ike_policy_id", "region"]
-            }
-        ),
-        Tool(
-            name="get_ipsec_policy",
-            description="Get detailed information about a specific IPsec policy",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ipsec_policy_id": {
-                        "type": "string",
-                        "description": "IPsec policy ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
                 },
-                "required": ["ipsec_policy_id", "region"]
-            }
-        ),
-        Tool(
-            name="get_vpn_server_client_configuration",
-            description="Get client configuration for a VPN server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpn_server_id": {
-                        "type": "string",
-                        "description": "VPN server ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_backup_policy_jobs",
+        description="List jobs for a specific backup policy",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "backup_policy_id": {
+                    "type": "string",
+                    "description": "Backup policy ID"
                 },
-                "required": ["vpn_server_id", "region"]
-            }
-        ),
-        Tool(
-            name="list_vpn_server_routes",
-            description="List routes for a VPN server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpn_server_id": {
-                        "type": "string",
-                        "description": "VPN server ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of routes to return (default 50)"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token"
-                    }
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
                 },
-                "required": ["vpn_server_id", "region"]
-            }
-        ),
-        Tool(
-            name="list_vpn_server_clients",
-            description="List clients connected to a VPN server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vpn_server_id": {
-                        "type": "string",
-                        "description": "VPN server ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Region name"
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of clients to return (default 50)"
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Pagination start token"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort field (e.g., 'created_at', 'common_name')"
-                    }
+                "status": {
+                    "type": "string",
+                    "description": "Filter by job status (optional)"
                 },
-                "required": ["vpn_server_id", "region"]
-            }
+                "backup_policy_plan_id": {
+                    "type": "string",
+                    "description": "Filter by plan ID (optional)"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort order (optional, e.g., '-created_at')"
+                },
+                "source_id": {
+                    "type": "string",
+                    "description": "Filter by source ID (optional)"
+                },
+                "target_snapshots_id": {
+                    "type": "string",
+                    "description": "Filter by target snapshot ID (optional)"
+                },
+                "target_snapshots_crn": {
+                    "type": "string",
+                    "description": "Filter by target snapshot CRN (optional)"
+                }
+            },
+            "required": ["backup_policy_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_backup_policy_plans",
+        description="List plans for a specific backup policy",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "backup_policy_id": {
+                    "type": "string",
+                    "description": "Backup policy ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by plan name (optional)"
+                }
+            },
+            "required": ["backup_policy_id", "region"]
+        }
+    ),
+    Tool(
+        name="get_backup_policy_summary",
+        description="Get comprehensive information about a backup policy including plans and recent jobs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "backup_policy_id": {
+                    "type": "string",
+                    "description": "Backup policy ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["backup_policy_id", "region"]
+        }
+    ),
+    Tool(
+        name="analyze_backup_policies",
+        description="Analyze backup policies in a region for health and compliance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "resource_group_id": {
+                    "type": "string",
+                    "description": "Filter by resource group ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="bulk_backup_report",
+        description="Summarize and health-check every backup policy in a region in one pass",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "resource_group_id": {
+                    "type": "string",
+                    "description": "Filter by resource group ID (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_volumes",
+        description="List block storage volumes in a region with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "attachment_state": {
+                    "type": "string",
+                    "description": "Filter by attachment state (optional: attached, unattached)"
+                },
+                "encryption": {
+                    "type": "string",
+                    "description": "Filter by encryption type (optional)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by volume name (optional)"
+                },
+                "operating_system_family": {
+                    "type": "string",
+                    "description": "Filter by operating system family (optional)"
+                },
+                "operating_system_architecture": {
+                    "type": "string",
+                    "description": "Filter by operating system architecture (optional)"
+                },
+                "tag": {
+                    "type": "string",
+                    "description": "Filter by tag (optional)"
+                },
+                "zone_name": {
+                    "type": "string",
+                    "description": "Filter by zone name (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_volume_profiles",
+        description="List available volume profiles in a region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_volume",
+        description="Get detailed information about a specific volume",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "volume_id": {
+                    "type": "string",
+                    "description": "Volume ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["volume_id", "region"]
+        }
+    ),
+    Tool(
+        name="analyze_storage_usage",
+        description="Analyze block storage usage in a region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_shares",
+        description="List file shares in a region with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "resource_group_id": {
+                    "type": "string",
+                    "description": "Filter by resource group ID (optional)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by share name (optional)"
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort order (optional)"
+                },
+                "replication_role": {
+                    "type": "string",
+                    "description": "Filter by replication role (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_share",
+        description="Get detailed information about a specific file share",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "share_id": {
+                    "type": "string",
+                    "description": "Share ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["share_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_share_profiles",
+        description="List available file share profiles in a region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort order (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_routing_tables",
+        description="List routing tables in a VPC (vpc_id is required)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "vpc_id": {
+                    "type": "string",
+                    "description": "VPC ID (required)"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "is_default": {
+                    "type": "boolean",
+                    "description": "Filter by default routing table (optional)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by routing table name (optional)"
+                }
+            },
+            "required": ["region", "vpc_id"]
+        }
+    ),
+    Tool(
+        name="get_routing_table",
+        description="Get detailed information about a specific routing table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpc_id": {
+                    "type": "string",
+                    "description": "VPC ID"
+                },
+                "routing_table_id": {
+                    "type": "string",
+                    "description": "Routing table ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["vpc_id", "routing_table_id", "region"]
+        }
+    ),
+    Tool(
+        name="find_routing_table_by_name",
+        description="Find a routing table by name and return its UUID and details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "vpc_id": {
+                    "type": "string",
+                    "description": "VPC ID"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Routing table name to search for"
+                }
+            },
+            "required": ["region", "vpc_id", "name"]
+        }
+    ),
+    Tool(
+        name="list_snapshots",
+        description="List block storage snapshots in a region with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by snapshot name (optional)"
+                },
+                "source_volume_id": {
+                    "type": "string",
+                    "description": "Filter by source volume ID (optional)"
+                },
+                "resource_group_id": {
+                    "type": "string",
+                    "description": "Filter by resource group ID (optional)"
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort order (optional)"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_snapshot",
+        description="Get detailed information about a specific snapshot",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "snapshot_id": {
+                    "type": "string",
+                    "description": "Snapshot ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["snapshot_id", "region"]
+        }
+    ),
+    Tool(
+        name="analyze_snapshot_usage",
+        description="Analyze snapshot usage in a region",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="list_vpn_gateways",
+        description="List VPN gateways in a region with optional VPC filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "vpc_id": {
+                    "type": "string",
+                    "description": "Optional VPC ID to filter gateways"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of gateways to return (default 50)"
+                },
+                "start": {
+                    "type": "string", 
+                    "description": "Pagination start token"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_vpn_gateway",
+        description="Get detailed information about a specific VPN gateway",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpn_gateway_id": {
+                    "type": "string",
+                    "description": "VPN gateway ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["vpn_gateway_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_vpn_servers",
+        description="List VPN servers in a region with optional name filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of servers to return (default 50)"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Optional name filter for servers"
+                }
+            },
+            "required": ["region"]
+        }
+    ),
+    Tool(
+        name="get_vpn_server", 
+        description="Get detailed information about a specific VPN server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpn_server_id": {
+                    "type": "string",
+                    "description": "VPN server ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["vpn_server_id", "region"]
+        }
+    ),
+    Tool(
+        name="get_ike_policy",
+        description="Get detailed information about a specific IKE policy",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ike_policy_id": {
+                    "type": "string",
+                    "description": "IKE policy ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["ike_policy_id", "region"]
+        }
+    ),
+    Tool(
+        name="get_ipsec_policy",
+        description="Get detailed information about a specific IPsec policy",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ipsec_policy_id": {
+                    "type": "string",
+                    "description": "IPsec policy ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["ipsec_policy_id", "region"]
+        }
+    ),
+    Tool(
+        name="get_vpn_server_client_configuration",
+        description="Get client configuration for a VPN server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpn_server_id": {
+                    "type": "string",
+                    "description": "VPN server ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                }
+            },
+            "required": ["vpn_server_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_vpn_server_routes",
+        description="List routes for a VPN server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpn_server_id": {
+                    "type": "string",
+                    "description": "VPN server ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of routes to return (default 50)"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token"
+                }
+            },
+            "required": ["vpn_server_id", "region"]
+        }
+    ),
+    Tool(
+        name="list_vpn_server_clients",
+        description="List clients connected to a VPN server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "vpn_server_id": {
+                    "type": "string",
+                    "description": "VPN server ID"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Region name"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of clients to return (default 50)"
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Pagination start token"
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort field (e.g., 'created_at', 'common_name')"
+                }
+            },
+            "required": ["vpn_server_id", "region"]
+        }
+    ),
+    Tool(
+        name="batch_call",
+        description="Run several tool calls concurrently and return all of their results in one response",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+]
+
+
+# Required argument names per tool, read once from the schemas above
+_REQUIRED_ARGUMENTS: Dict[str, tuple] = {
+    tool.name: tuple(tool.inputSchema.get('required', ())) for tool in _TOOLS
+}
+
+
+_NO_API_KEY_MESSAGE = "IBMCLOUD_API_KEY environment variable not set"
+# Shared reply text for calls made before an API key is configured; TextContent is mutable, so only the text is reused
+_NO_API_KEY_TEXT = f"Error: {_NO_API_KEY_MESSAGE}"
+
+
+class VPCMCPServer:
+    # Fixed attribute set; call_tool reads the managers on every request
+    __slots__ = ('server', 'vpc_manager', 'storage_manager', '_dispatch', '_init_options', '_warmup_task')
+
+    # Seconds the background startup warmup may take before it is abandoned
+    STARTUP_WARMUP_TIMEOUT = 15
+
+    def __init__(self):
+        self.server = Server("ibm-vpc-mcp")
+        self.vpc_manager = None
+        self.storage_manager = None
+        self._dispatch = self._build_dispatch()
+        self._setup_handlers()
+        self._init_options = self.server.create_initialization_options()
+        self._warmup_task = None
+
+    def _build_dispatch(self) -> Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]]:
+        """Map each tool name to a callable that invokes its manager method with the tool arguments"""
+        return {
+            "list_regions": lambda arguments: self.vpc_manager.list_regions(),
+            "list_vpcs": lambda arguments: self.vpc_manager.list_vpcs(arguments.get('region')),
+            "get_vpc": lambda arguments: self.vpc_manager.get_vpc(arguments['vpc_id'], arguments['region']),
+            "list_subnets": lambda arguments: self.vpc_manager.list_subnets(arguments['region'], arguments.get('vpc_id')),
+            "list_instances": lambda arguments: self.vpc_manager.list_instances(arguments['region'], arguments.get('vpc_id')),
+            "list_instance_profiles": lambda arguments: self.vpc_manager.list_instance_profiles(arguments['region']),
+            "list_public_gateways": lambda arguments: self.vpc_manager.list_public_gateways(arguments['region'], arguments.get('vpc_id')),
+            "list_security_groups": lambda arguments: self.vpc_manager.list_security_groups(arguments['region'], arguments.get('vpc_id')),
+            "get_security_group": lambda arguments: self.vpc_manager.get_security_group(arguments['security_group_id'], arguments['region']),
+            "list_security_group_rules": lambda arguments: self.vpc_manager.list_security_group_rules(arguments['security_group_id'], arguments['region']),
+            "analyze_ssh_security_groups": lambda arguments: self.vpc_manager.analyze_ssh_security_groups(arguments['region'], arguments.get('vpc_id')),
+            "analyze_ssh_security_groups_all_regions": lambda arguments: self.vpc_manager.analyze_ssh_security_groups_all_regions(),
+            "analyze_security_groups_by_protocol": lambda arguments: self.vpc_manager.analyze_security_groups_by_protocol(
+                arguments['region'],
+                arguments['protocol'],
+                arguments.get('port'),
+                arguments.get('source_cidr', '0.0.0.0/0'),
+                arguments.get('vpc_id')
+            ),
+            "list_floating_ips": lambda arguments: self.vpc_manager.list_floating_ips(arguments['region']),
+            "get_vpc_resources_summary": lambda arguments: self.vpc_manager.get_vpc_resources_summary(arguments['vpc_id'], arguments['region']),
+            # Backup Policy handlers
+            "list_backup_policies": lambda arguments: self.vpc_manager.list_backup_policies(
+                arguments['region'],
+                arguments.get('resource_group_id'),
+                arguments.get('name'),
+                arguments.get('tag'),
+                arguments.get('start'),
+                arguments.get('limit')
+            ),
+            "list_backup_policy_jobs": lambda arguments: self.vpc_manager.list_backup_policy_jobs(
+                arguments['backup_policy_id'],
+                arguments['region'],
+                arguments.get('status'),
+                arguments.get('backup_policy_plan_id'),
+                arguments.get('start'),
+                arguments.get('limit'),
+                arguments.get('sort'),
+                arguments.get('source_id'),
+                arguments.get('target_snapshots_id'),
+                arguments.get('target_snapshots_crn')
+            ),
+            "list_backup_policy_plans": lambda arguments: self.vpc_manager.list_backup_policy_plans(
+                arguments['backup_policy_id'],
+                arguments['region'],
+                arguments.get('name')
+            ),
+            "get_backup_policy_summary": lambda arguments: self.vpc_manager.get_backup_policy_summary(
+                arguments['backup_policy_id'],
+                arguments['region']
+            ),
+            "analyze_backup_policies": lambda arguments: self.vpc_manager.analyze_backup_policies(
+                arguments['region'],
+                arguments.get('resource_group_id')
+            ),
+            "bulk_backup_report": lambda arguments: self.vpc_manager.bulk_backup_report(
+                arguments['region'],
+                arguments.get('resource_group_id')
+            ),
+            "list_volumes": lambda arguments: self.storage_manager.list_volumes(
+                arguments['region'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit'),
+                attachment_state=arguments.get('attachment_state'),
+                encryption=arguments.get('encryption'),
+                name=arguments.get('name'),
+                operating_system_family=arguments.get('operating_system_family'),
+                operating_system_architecture=arguments.get('operating_system_architecture'),
+                tag=arguments.get('tag'),
+                zone_name=arguments.get('zone_name')
+            ),
+            "list_volume_profiles": lambda arguments: self.storage_manager.list_volume_profiles(
+                arguments['region'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit')
+            ),
+            "get_volume": lambda arguments: self.storage_manager.get_volume(
+                arguments['volume_id'],
+                arguments['region']
+            ),
+            "analyze_storage_usage": lambda arguments: self.storage_manager.analyze_storage_usage(
+                arguments['region']
+            ),
+            "list_shares": lambda arguments: self.storage_manager.list_shares(
+                arguments['region'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit'),
+                resource_group_id=arguments.get('resource_group_id'),
+                name=arguments.get('name'),
+                sort=arguments.get('sort'),
+                replication_role=arguments.get('replication_role')
+            ),
+            "get_share": lambda arguments: self.storage_manager.get_share(
+                arguments['share_id'],
+                arguments['region']
+            ),
+            "list_share_profiles": lambda arguments: self.storage_manager.list_share_profiles(
+                arguments['region'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit'),
+                sort=arguments.get('sort')
+            ),
+            "list_routing_tables": lambda arguments: self.vpc_manager.list_routing_tables(
+                arguments['region'],
+                arguments['vpc_id'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit'),
+                is_default=arguments.get('is_default'),
+                name=arguments.get('name')
+            ),
+            "get_routing_table": lambda arguments: self.vpc_manager.get_routing_table(
+                arguments['vpc_id'],
+                arguments['routing_table_id'],
+                arguments['region']
+            ),
+            "find_routing_table_by_name": lambda arguments: self.vpc_manager.find_routing_table_by_name(
+                arguments['region'],
+                arguments['vpc_id'],
+                arguments['name']
+            ),
+            "list_snapshots": lambda arguments: self.storage_manager.list_snapshots(
+                arguments['region'],
+                start=arguments.get('start'),
+                limit=arguments.get('limit'),
+                name=arguments.get('name'),
+                source_volume_id=arguments.get('source_volume_id'),
+                resource_group_id=arguments.get('resource_group_id'),
+                sort=arguments.get('sort')
+            ),
+            "get_snapshot": lambda arguments: self.storage_manager.get_snapshot(
+                arguments['snapshot_id'],
+                arguments['region']
+            ),
+            "analyze_snapshot_usage": lambda arguments: self.storage_manager.analyze_snapshot_usage(
+                arguments['region']
+            ),
+            "list_vpn_gateways": lambda arguments: self.vpc_manager.list_vpn_gateways(
+                arguments['region'],
+                arguments.get('vpc_id'),
+                arguments.get('limit', 50),
+                arguments.get('start')
+            ),
+            "get_vpn_gateway": lambda arguments: self.vpc_manager.get_vpn_gateway(
+                arguments['vpn_gateway_id'],
+                arguments['region']
+            ),
+            "list_vpn_servers": lambda arguments: self.vpc_manager.list_vpn_servers(
+                arguments['region'],
+                arguments.get('limit', 50),
+                arguments.get('start'),
+                arguments.get('name')
+            ),
+            "get_vpn_server": lambda arguments: self.vpc_manager.get_vpn_server(
+                arguments['vpn_server_id'],
+                arguments['region']
+            ),
+            "get_ike_policy": lambda arguments: self.vpc_manager.get_ike_policy(
+                arguments['ike_policy_id'],
+                arguments['region']
+            ),
+            "get_ipsec_policy": lambda arguments: self.vpc_manager.get_ipsec_policy(
+                arguments['ipsec_policy_id'],
+                arguments['region']
+            ),
+            "get_vpn_server_client_configuration": lambda arguments: self.vpc_manager.get_vpn_server_client_configuration(
+                arguments['vpn_server_id'],
+                arguments['region']
+            ),
+            "list_vpn_server_routes": lambda arguments: self.vpc_manager.list_vpn_server_routes(
+                arguments['vpn_server_id'],
+                arguments['region'],
+                arguments.get('limit', 50),
+                arguments.get('start')
+            ),
+            "list_vpn_server_clients": lambda arguments: self.vpc_manager.list_vpn_server_clients(
+                arguments['vpn_server_id'],
+                arguments['region'],
+                arguments.get('limit', 50),
+                arguments.get('start'),
+                arguments.get('sort')
+            ),
+            "batch_call": lambda arguments: self._batch_call(arguments['calls'])
+        }
+
+    def _build_managers(self) -> Tuple[VPCManager, StorageManager]:
+        """Build VPC and storage managers from the environment"""
+        api_key = os.environ.get('IBMCLOUD_API_KEY')
+        if not api_key:
+            raise ValueError(_NO_API_KEY_MESSAGE)
+        authenticator = IAMAuthenticator(apikey=api_key)
+        vpc_manager = VPCManager(
+            authenticator,
+            cache_dir=os.environ.get('IBMCLOUD_MCP_CACHE_DIR'),
+            max_concurrency=int(os.environ.get('VPC_MAX_CONCURRENCY', VPCManager.FAN_OUT_CONCURRENCY))
         )
-    ]
-    
+        # Storage calls reuse the VPC manager's pooled, keep-alive session
+        storage_manager = StorageManager(None, authenticator, http_session=vpc_manager.http_session)
+        return vpc_manager, storage_manager
+
+    def _create_managers(self) -> None:
+        """Build the VPC and storage managers from the environment and install them"""
+        self.vpc_manager, self.storage_manager = self._build_managers()
+
+    async def _startup(self) -> None:
+        """Build the managers and warm the IAM token, connection pool and region cache
+
+        Runs in the background once serving starts. The managers are only installed if the warmup succeeds,
+        so after a failure the first tool call builds them afresh.
+        """
+        if not os.environ.get('IBMCLOUD_API_KEY'):
+            logger.warning("%s; skipping startup warmup, tool calls will fail until it is set", _NO_API_KEY_MESSAGE)
+            return
+        try:
+            vpc_manager, storage_manager = self._build_managers()
+        except Exception as e:
+            logger.warning("Could not create managers at startup, retrying on the first tool call: %s", e)
+            return
+        try:
+            await asyncio.wait_for(vpc_manager.list_regions(), self.STARTUP_WARMUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            vpc_manager.close()
+            logger.warning("Startup warmup timed out after %ss, retrying on the first tool call", self.STARTUP_WARMUP_TIMEOUT)
+            return
+        except Exception as e:
+            vpc_manager.close()
+            logger.warning("Startup warmup failed, retrying on the first tool call: %s", e)
+            return
+        except asyncio.CancelledError:
+            vpc_manager.close()
+            raise
+        if self.vpc_manager:
+            # A tool call arrived first and built its own managers; keep those
+            vpc_manager.close()
+            return
+        self.vpc_manager, self.storage_manager = vpc_manager, storage_manager
+
+    def _check_arguments(self, name: str, arguments: Dict[str, Any]) -> None:
+        """Raise ValueError for an unknown tool or a call missing required arguments"""
+        if name not in self._dispatch:
+            raise ValueError(f"Unknown tool: {name}")
+        missing = [field for field in _REQUIRED_ARGUMENTS[name] if field not in arguments]
+        if missing:
+            raise ValueError(f"Invalid arguments: missing required {', '.join(missing)}")
+
+    def _invoke(self, name: str, arguments: Dict[str, Any]) -> Awaitable[Any]:
+        """Check a tool call's required arguments and return the awaitable that runs it"""
+        self._check_arguments(name, arguments)
+        return self._dispatch[name](arguments)
+
+    async def _summary_ndjson(self, vpc_id: str, region: str) -> str:
+        """Serialize a VPC summary as newline-delimited JSON: a header line, then one line per section in fixed order"""
+        header = {
+            'vpc_id': vpc_id,
+            'region': region,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        lines = [_dumps_result(header, indent=False)]
+        for section, payload in await self.vpc_manager.vpc_resources_summary_sections(vpc_id, region):
+            lines.append(_dumps_result({section: payload}, indent=False))
+        return '\n'.join(lines)
+
+    async def _batch_call(self, calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run several tool calls concurrently, reporting each call's result or error in request order"""
+        async def _run(call: Dict[str, Any]) -> Any:
+            if call.get('name') == 'batch_call':
+                raise ValueError("batch_call cannot be nested")
+            return await self._invoke(call.get('name'), call.get('arguments') or {})
+        
+        results = await asyncio.gather(*[_run(call) for call in calls], return_exceptions=True)
+        
+        batch = []
+        for call, result in zip(calls, results):
+            if isinstance(result, Exception):
+                logger.error("Error executing batched tool %s: %s", call.get('name'), result)
+                batch.append({'name': call.get('name'), 'error': str(result)})
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                batch.append({'name': call.get('name'), 'result': result})
+        
+        return {
+            'results': batch,
+            'count': len(batch)
+        }
+
+    def _setup_handlers(self):
+        """Set up MCP server handlers"""
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return _TOOLS
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             try:
-                # Initialize VPC manager if not already done
+                # Normally built at startup; only retried here if that failed (e.g. no API key yet)
                 if not self.vpc_manager:
-                    api_key = os.environ.get('IBMCLOUD_API_KEY')
-                    if not api_key:
-                        raise ValueError("IBMCLOUD_API_KEY environment variable not set")
-                    authenticator = IAMAuthenticator(apikey=api_key)
-                    self.vpc_manager = VPCManager(authenticator)
-                    self.storage_manager = StorageManager(None, authenticator)
+                    if not os.environ.get('IBMCLOUD_API_KEY'):
+                        return [TextContent(type="text", text=_NO_API_KEY_TEXT)]
+                    self._create_managers()
+                
+                # Summaries go out as one compact NDJSON line per section rather than one indented document
+                if name == "get_vpc_resources_summary":
+                    self._check_arguments(name, arguments)
+                    return [TextContent(
+                        type="text",
+                        text=await self._summary_ndjson(arguments['vpc_id'], arguments['region'])
+                    )]
                 
                 # Route to appropriate handler
-                if name == "list_regions":
-                    result = await self.vpc_manager.list_regions()
-                elif name == "list_vpcs":
-                    result = await self.vpc_manager.list_vpcs(arguments.get('region'))
-                elif name == "get_vpc":
-                    result = await self.vpc_manager.get_vpc(arguments['vpc_id'], arguments['region'])
-                elif name == "list_subnets":
-                    result = await self.vpc_manager.list_subnets(arguments['region'], arguments.get('vpc_id'))
-                elif name == "list_instances":
-                    result = await self.vpc_manager.list_instances(arguments['region'], arguments.get('vpc_id'))
-                elif name == "list_instance_profiles":
-                    result = await self.vpc_manager.list_instance_profiles(arguments['region'])
-                elif name == "list_public_gateways":
-                    result = await self.vpc_manager.list_public_gateways(arguments['region'], arguments.get('vpc_id'))
-                elif name == "list_security_groups":
-                    result = await self.vpc_manager.list_security_groups(arguments['region'], arguments.get('vpc_id'))
-                elif name == "get_security_group":
-                    result = await self.vpc_manager.get_security_group(arguments['security_group_id'], arguments['region'])
-                elif name == "list_security_group_rules":
-                    result = await self.vpc_manager.list_security_group_rules(arguments['security_group_id'], arguments['region'])
-                elif name == "analyze_ssh_security_groups":
-                    result = await self.vpc_manager.analyze_ssh_security_groups(arguments['region'], arguments.get('vpc_id'))
-                elif name == "analyze_security_groups_by_protocol":
-                    result = await self.vpc_manager.analyze_security_groups_by_protocol(
-                        arguments['region'], 
-                        arguments['protocol'],
-                        arguments.get('port'),
-                        arguments.get('source_cidr', '0.0.0.0/0'),
-                        arguments.get('vpc_id')
-                    )
-                elif name == "list_floating_ips":
-                    result = await self.vpc_manager.list_floating_ips(arguments['region'])
-                elif name == "get_vpc_resources_summary":
-                    result = await self.vpc_manager.get_vpc_resources_summary(arguments['vpc_id'], arguments['region'])
-                # Backup Policy handlers
-                elif name == "list_backup_policies":
-                    result = await self.vpc_manager.list_backup_policies(
-                        arguments['region'],
-                        arguments.get('resource_group_id'),
-                        arguments.get('name'),
-                        arguments.get('tag'),
-                        arguments.get('start'),
-                        arguments.get('limit')
-                    )
-                elif name == "list_backup_policy_jobs":
-                    result = await self.vpc_manager.list_backup_policy_jobs(
-                        arguments['backup_policy_id'],
-                        arguments['region'],
-                        arguments.get('status'),
-                        arguments.get('backup_policy_plan_id'),
-                        arguments.get('start'),
-                        arguments.get('limit'),
-                        arguments.get('sort'),
-                        arguments.get('source_id'),
-                        arguments.get('target_snapshots_id'),
-                        arguments.get('target_snapshots_crn')
-                    )
-                elif name == "list_backup_policy_plans":
-                    result = await self.vpc_manager.list_backup_policy_plans(
-                        arguments['backup_policy_id'],
-                        arguments['region'],
-                        arguments.get('name')
-                    )
-                elif name == "get_backup_policy_summary":
-                    result = await self.vpc_manager.get_backup_policy_summary(
-                        arguments['backup_policy_id'],
-                        arguments['region']
-                    )
-                elif name == "analyze_backup_policies":
-                    result = await self.vpc_manager.analyze_backup_policies(
-                        arguments['region'],
-                        arguments.get('resource_group_id')
-                    )
-                elif name == "list_volumes":
-                    result = await self.storage_manager.list_volumes(
-                        arguments['region'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit'),
-                        attachment_state=arguments.get('attachment_state'),
-                        encryption=arguments.get('encryption'),
-                        name=arguments.get('name'),
-                        operating_system_family=arguments.get('operating_system_family'),
-                        operating_system_architecture=arguments.get('operating_system_architecture'),
-                        tag=arguments.get('tag'),
-                        zone_name=arguments.get('zone_name')
-                    )
-                elif name == "list_volume_profiles":
-                    result = await self.storage_manager.list_volume_profiles(
-                        arguments['region'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit')
-                    )
-                elif name == "get_volume":
-                    result = await self.storage_manager.get_volume(
-                        arguments['volume_id'],
-                        arguments['region']
-                    )
-                elif name == "analyze_storage_usage":
-                    result = await self.storage_manager.analyze_storage_usage(
-                        arguments['region']
-                    )
-                elif name == "list_shares":
-                    result = await self.storage_manager.list_shares(
-                        arguments['region'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit'),
-                        resource_group_id=arguments.get('resource_group_id'),
-                        name=arguments.get('name'),
-                        sort=arguments.get('sort'),
-                        replication_role=arguments.get('replication_role')
-                    )
-                elif name == "get_share":
-                    result = await self.storage_manager.get_share(
-                        arguments['share_id'],
-                        arguments['region']
-                    )
-                elif name == "list_share_profiles":
-                    result = await self.storage_manager.list_share_profiles(
-                        arguments['region'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit'),
-                        sort=arguments.get('sort')
-                    )
-                elif name == "list_routing_tables":
-                    result = await self.vpc_manager.list_routing_tables(
-                        arguments['region'],
-                        arguments['vpc_id'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit'),
-                        is_default=arguments.get('is_default'),
-                        name=arguments.get('name')
-                    )
-                elif name == "get_routing_table":
-                    result = await self.vpc_manager.get_routing_table(
-                        arguments['vpc_id'],
-                        arguments['routing_table_id'],
-                        arguments['region']
-                    )
-                elif name == "find_routing_table_by_name":
-                    result = await self.vpc_manager.find_routing_table_by_name(
-                        arguments['region'],
-                        arguments['vpc_id'],
-                        arguments['name']
-                    )
-                elif name == "list_snapshots":
-                    result = await self.storage_manager.list_snapshots(
-                        arguments['region'],
-                        start=arguments.get('start'),
-                        limit=arguments.get('limit'),
-                        name=arguments.get('name'),
-                        source_volume_id=arguments.get('source_volume_id'),
-                        resource_group_id=arguments.get('resource_group_id'),
-                        sort=arguments.get('sort')
-                    )
-                elif name == "get_snapshot":
-                    result = await self.storage_manager.get_snapshot(
-                        arguments['snapshot_id'],
-                        arguments['region']
-                    )
-                elif name == "analyze_snapshot_usage":
-                    result = await self.storage_manager.analyze_snapshot_usage(
-                        arguments['region']
-                    )
-                elif name == "list_vpn_gateways":
-                    result = await self.vpc_manager.list_vpn_gateways(
-                        arguments['region'],
-                        arguments.get('vpc_id'),
-                        arguments.get('limit', 50),
-                        arguments.get('start')
-                    )
-                elif name == "get_vpn_gateway":
-                    result = await self.vpc_manager.get_vpn_gateway(
-                        arguments['vpn_gateway_id'],
-                        arguments['region']
-                    )
-                elif name == "list_vpn_servers":
-                    result = await self.vpc_manager.list_vpn_servers(
-                        arguments['region'],
-                        arguments.get('limit', 50),
-                        arguments.get('start'),
-                        arguments.get('name')
-                    )
-                elif name == "get_vpn_server":
-                    result = await self.vpc_manager.get_vpn_server(
-                        arguments['vpn_server_id'],
-                        arguments['region']
-                    )
-                elif name == "get_ike_policy":
-                    result = await self.vpc_manager.get_ike_policy(
-                        arguments['ike_policy_id'],
-                        arguments['region']
-                    )
-                elif name == "get_ipsec_policy":
-                    result = await self.vpc_manager.get_ipsec_policy(
-                        arguments['ipsec_policy_id'],
-                        arguments['region']
-                    )
-                elif name == "get_vpn_server_client_configuration":
-                    result = await self.vpc_manager.get_vpn_server_client_configuration(
-                        arguments['vpn_server_id'],
-                        arguments['region']
-                    )
-                elif name == "list_vpn_server_routes":
-                    result = await self.vpc_manager.list_vpn_server_routes(
-                        arguments['vpn_server_id'],
-                        arguments['region'],
-                        arguments.get('limit', 50),
-                        arguments.get('start')
-                    )
-                elif name == "list_vpn_server_clients":
-                    result = await self.vpc_manager.list_vpn_server_clients(
-                        arguments['vpn_server_id'],
-                        arguments['region'],
-                        arguments.get('limit', 50),
-                        arguments.get('start'),
-                        arguments.get('sort')
-                    )
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
+                result = await self._invoke(name, arguments)
                 
                 return [TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=await _dumps_result_async(result)
                 )]
                 
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {str(e)}")
+                logger.error("Error executing tool %s: %s", name, e)
                 return [TextContent(
                     type="text",
                     text=f"Error: {str(e)}"
@@ -1204,12 +1385,20 @@ class VPCMCPServer:
                 
     async def run(self):
         """Run the MCP server"""
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                # Warm up in the background so a slow IAM or region endpoint cannot hold up the initialize handshake
+                self._warmup_task = asyncio.create_task(self._startup())
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self._init_options
+                )
+        finally:
+            if self._warmup_task:
+                self._warmup_task.cancel()
+            if self.vpc_manager:
+                self.vpc_manager.close()
 
 
 async def main():